@@ -2887,7 +2887,10 @@ class SlashCommands(commands.Cog):
         # aiohttp 세션 생성 및 처리
         try:
             async with aiohttp.ClientSession() as session:
-                result = await process_single_user(interaction.client, session, discord_id)
+                result = await process_single_user(
+                    interaction.client, session, discord_id,
+                    refresh=True, priority=True, requeue=False
+                )
 
             # 결과 확인 및 사용자별 메시지 생성
             if result and result.get('success'):
@@ -3281,6 +3284,62 @@ class SlashCommands(commands.Cog):
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @app_commands.command(name="스케줄러프로파일", description="스케줄러 함수별 실행/대기 시간을 확인합니다")
+    @app_commands.describe(초기화="조회 후 누적된 프로파일 결과를 초기화합니다")
+    @app_commands.check(is_admin)
+    async def 스케줄러프로파일(self, interaction: discord.Interaction, 초기화: bool = False):
+        """스케줄러 프로파일 결과 조회"""
+        try:
+            from scheduler import get_profile_stats, reset_profile_stats
+
+            stats = get_profile_stats()
+
+            if stats is None:
+                embed = discord.Embed(
+                    title="⚠️ 프로파일링 비활성화",
+                    description="`.env`에 `SCHEDULER_PROFILE=true`를 설정하고 봇을 재시작해주세요.",
+                    color=0xff9900
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+
+            embed = discord.Embed(
+                title="⏱️ 스케줄러 프로파일",
+                color=0x00ff00
+            )
+
+            if stats:
+                lines = ["함수                      호출     전체(s)   실행(s)   대기(s)"]
+                for item in stats:
+                    lines.append(
+                        f"{item['name'][:24]:<24} {item['calls']:>6} "
+                        f"{item['total']:>9.2f} {item['active']:>9.2f} {item['await']:>9.2f}"
+                    )
+                embed.description = "```\n" + "\n".join(lines) + "\n```"
+            else:
+                embed.description = "아직 기록된 데이터가 없습니다."
+
+            if 초기화:
+                reset_profile_stats()
+                embed.set_footer(text="프로파일 결과가 초기화되었습니다.")
+
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        except ImportError:
+            embed = discord.Embed(
+                title="❌ 오류",
+                description="scheduler 모듈을 로드할 수 없습니다.",
+                color=0xff0000
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        except Exception as e:
+            embed = discord.Embed(
+                title="❌ 오류 발생",
+                description=f"프로파일 정보를 가져오는 중 오류가 발생했습니다.\n{str(e)}",
+                color=0xff0000
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(name="자동실행시작", description="자동 역할 부여를 수동으로 시작합니다")
     @app_commands.check(is_admin)
     async def 자동실행시작(self, interaction: discord.Interaction):
@@ -53,6 +53,9 @@ class Config:
         
         # 추가 설정
         self.AUTO_ADD_NEW_MEMBERS = self._get_env_bool("AUTO_ADD_NEW_MEMBERS", True)
+        self.SCHEDULER_LOG_LEVEL = self._get_env("SCHEDULER_LOG_LEVEL", "INFO").upper()  # 스케줄러 상세 로그 레벨
+        self.SCHEDULER_PROFILE = self._get_env_bool("SCHEDULER_PROFILE", False)  # 스케줄러 코루틴 프로파일링
+        self.MC_API_REQUESTS_PER_MINUTE = self._get_env_int("MC_API_REQUESTS_PER_MINUTE", 10)  # 마인크래프트 API 분당 요청 한도
 
         # 인증 관련 설정
         self.BASE_NATION = self._get_env("BASE_NATION", "Red_Mafia")  # Legacy: 이름 기반
@@ -232,6 +232,40 @@ class DatabaseManager:
             print(f"❌ 사용자 정보 조회 실패: {e}")
             return None
 
+    def get_users_info(self, discord_ids: List[int]) -> Dict[int, Dict]:
+        """
+        여러 사용자 기본 정보를 한 번에 조회
+
+        Args:
+            discord_ids: 디스코드 사용자 ID 목록
+
+        Returns:
+            {디스코드 ID: 사용자 정보 딕셔너리} (DB에 없는 사용자는 제외)
+        """
+        result = {}
+        ids = list(discord_ids)
+        if not ids:
+            return result
+
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            # SQLite 바인딩 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+            for start in range(0, len(ids), 900):
+                chunk = ids[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f'SELECT * FROM users WHERE discord_id IN ({placeholders})', chunk)
+                for row in cursor.fetchall():
+                    result[row['discord_id']] = dict(row)
+
+            conn.close()
+            return result
+
+        except Exception as e:
+            print(f"❌ 사용자 정보 일괄 조회 실패: {e}")
+            return result
+
     def get_name_history(self, discord_id: int, limit: int = 10) -> List[Dict]:
         """
         Minecraft 닉네임 히스토리 조회
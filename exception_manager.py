@@ -1,6 +1,6 @@
 import json
 import os
-from typing import List, Set
+from typing import FrozenSet, List, Optional, Set
 
 class ExceptionManager:
     def __init__(self, filename: str = "data/exceptions.json"):
@@ -9,10 +9,12 @@ class ExceptionManager:
 
         self.filename = filename
         self._exceptions: Set[int] = set()
+        self._snapshot: Optional[FrozenSet[int]] = None  # get_all_exception_ids() 캐시
         self.load_exceptions()
     
     def load_exceptions(self):
         """예외 목록을 파일에서 로드"""
+        self._snapshot = None
         try:
             if os.path.exists(self.filename):
                 with open(self.filename, 'r', encoding='utf-8') as f:
@@ -43,6 +45,7 @@ class ExceptionManager:
         """예외 목록에 사용자 추가"""
         if user_id not in self._exceptions:
             self._exceptions.add(user_id)
+            self._snapshot = None
             self.save_exceptions()
             print(f"➕ 예외 추가: {user_id}")
             return True
@@ -52,6 +55,7 @@ class ExceptionManager:
         """예외 목록에서 사용자 제거"""
         if user_id in self._exceptions:
             self._exceptions.remove(user_id)
+            self._snapshot = None
             self.save_exceptions()
             print(f"➖ 예외 제거: {user_id}")
             return True
@@ -61,6 +65,12 @@ class ExceptionManager:
         """사용자가 예외 목록에 있는지 확인"""
         return user_id in self._exceptions
     
+    def get_all_exception_ids(self) -> FrozenSet[int]:
+        """예외 목록 ID 집합 반환 (대량 조회용 스냅샷, 목록이 바뀔 때만 다시 생성)"""
+        if self._snapshot is None:
+            self._snapshot = frozenset(self._exceptions)
+        return self._snapshot
+    
     def get_exceptions(self) -> List[int]:
         """예외 목록 반환"""
         return list(self._exceptions)
@@ -572,10 +572,26 @@ async def main():
     finally:
         # 봇 종료 시 스케줄러 정리
         try:
-            from scheduler import stop_scheduler
+            from scheduler import stop_scheduler, close_http_session
             stop_scheduler()
+            await close_http_session()
         except Exception as e:
             print(f"⚠️ 스케줄러 정리 실패: {e}")
+        finally:
+            # 스케줄러 정리 도중 실패해도 로그 출력 스레드는 반드시 종료
+            try:
+                from scheduler import stop_log_listener
+                stop_log_listener()
+            except Exception:
+                pass
+
+        # 아직 파일에 쓰지 않은 마을 역할 매핑 저장 및 HTTP 세션 종료
+        try:
+            from town_role_manager import town_role_manager, close_http_session as close_town_http_session
+            await town_role_manager.flush()
+            await close_town_http_session()
+        except Exception as e:
+            print(f"⚠️ 마을 역할 매핑 정리 실패: {e}")
 
 # 메인 실행
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import asyncio
 from collections import deque
 
 # queue_manager.py에 다음 메서드를 추가하세요
@@ -6,6 +7,15 @@ class QueueManager:
     def __init__(self):
         self.queue = []  # 또는 다른 데이터 구조
         self.processing = False
+        self._dequeued = False  # 마지막 완료 알림 이후 꺼낸 사용자가 있는지
+        self._drained = None    # 대기열 처리 완료 이벤트 (이벤트 루프 안에서 처음 사용할 때 생성)
+    
+    @property
+    def drained(self) -> asyncio.Event:
+        """대기열이 모두 처리되면 set 되는 이벤트"""
+        if self._drained is None:
+            self._drained = asyncio.Event()
+        return self._drained
     
     def is_user_in_queue(self, user_id: int) -> bool:
         """사용자가 이미 대기열에 있는지 확인"""
@@ -18,9 +28,21 @@ class QueueManager:
             return True
         return False
     
+    def add_users(self, user_ids) -> set:
+        """여러 사용자를 한 번에 대기열에 추가 (중복 방지), 새로 추가된 ID 집합 반환"""
+        queued = set(self.queue)
+        added = set()
+        for user_id in user_ids:
+            if user_id not in queued:
+                queued.add(user_id)
+                added.add(user_id)
+                self.queue.append(user_id)
+        return added
+    
     def get_next(self):
         """대기열에서 다음 사용자 가져오기"""
         if self.queue:
+            self._dequeued = True
             return self.queue.pop(0)
         return None
     
@@ -28,6 +50,13 @@ class QueueManager:
         """현재 대기열 크기 반환"""
         return len(self.queue)
     
+    def end_batch(self):
+        """배치 처리 종료 - 꺼낸 사용자가 있었고 대기열이 비었으면 drained 이벤트 발생"""
+        self.processing = False
+        if self._dequeued and not self.queue:
+            self._dequeued = False
+            self.drained.set()
+    
     def is_processing(self) -> bool:
         """현재 처리 중인지 여부 반환"""
         return self.processing
@@ -0,0 +1,249 @@
+import asyncio
+import time
+from collections import deque
+
+
+class AsyncLimiter:
+    """time_period 초 동안 최대 max_rate 회의 요청을 허용하는 비동기 속도 제한기 (leaky bucket)
+
+    사용 예:
+        limiter = AsyncLimiter(6, 60)
+        async with limiter:
+            ...  # API 요청
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60):
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate와 time_period는 0보다 커야 합니다.")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = None  # 이벤트 루프 안에서 처음 사용할 때 생성
+        self._priority_waiting = 0  # 일반 요청보다 먼저 처리할 대기 중인 요청 수
+
+    def _leak(self):
+        """경과 시간만큼 버킷 수위를 낮춤"""
+        now = time.monotonic()
+        if self._level > 0:
+            elapsed = now - self._last_check
+            self._level = max(0.0, self._level - elapsed * self._rate_per_sec)
+        self._last_check = now
+
+    def has_capacity(self, amount: float = 1) -> bool:
+        """지금 바로 amount 만큼 요청할 수 있는지 확인"""
+        self._leak()
+        return self._level + amount <= self.max_rate
+
+    def _wait_time(self, amount: float) -> float:
+        """amount 만큼 요청할 수 있을 때까지 남은 시간(초)"""
+        return max(0.0, (self._level + amount - self.max_rate) / self._rate_per_sec)
+
+    async def acquire(self, amount: float = 1, priority: bool = False):
+        """요청 가능할 때까지 대기 후 amount 만큼 사용
+
+        일반 요청은 FIFO 순서로 대기하고, priority=True 요청은 대기 줄을 건너뛰어
+        다음에 비는 슬롯을 먼저 가져갑니다 (사용자가 직접 실행한 명령어 등).
+        """
+        if amount > self.max_rate:
+            raise ValueError("한 번에 max_rate보다 많이 요청할 수 없습니다.")
+
+        if priority:
+            self._priority_waiting += 1
+            try:
+                while not self.has_capacity(amount):
+                    await asyncio.sleep(self._wait_time(amount))
+                self._level += amount
+            finally:
+                self._priority_waiting -= 1
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # 우선 요청이 기다리는 동안에는 슬롯이 비어도 양보
+            while self._priority_waiting or not self.has_capacity(amount):
+                await asyncio.sleep(max(0.05, self._wait_time(amount)))
+            self._level += amount
+
+    async def __aenter__(self):
+        await self.acquire()
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+class ConcurrencyController:
+    """AIMD(가산 증가/곱셈 감소) 방식으로 동시 실행 수를 조절하는 비동기 제한기
+
+    성공할 때마다 허용 동시 실행 수를 increase 만큼 늘리고,
+    429/5xx 같은 과부하 신호를 받으면 decrease 배로 줄입니다.
+
+    사용 예:
+        controller = ConcurrencyController(min_limit=1, max_limit=8)
+        async with controller:
+            ...  # Discord 요청
+        await controller.on_success()
+    """
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 8, initial: float = None,
+                 increase: float = 0.5, decrease: float = 0.5):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("1 <= min_limit <= max_limit 이어야 합니다.")
+        if increase <= 0 or not (0 < decrease < 1):
+            raise ValueError("increase는 0보다 크고 decrease는 0과 1 사이여야 합니다.")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.current = float(initial if initial is not None else max_limit / 2)
+        self.current = min(max_limit, max(min_limit, self.current))
+        self.pause_until = 0.0  # Retry-After 동안 새 작업 시작 보류 (time.monotonic 기준)
+        self._active = 0
+        self._cond = None  # 이벤트 루프 안에서 처음 사용할 때 생성
+
+    @property
+    def limit(self) -> int:
+        """현재 허용 동시 실행 수"""
+        return max(self.min_limit, int(self.current))
+
+    @property
+    def active(self) -> int:
+        """현재 실행 중인 작업 수"""
+        return self._active
+
+    async def on_success(self):
+        """작업 성공 - 허용 동시 실행 수를 조금씩 늘리고, 늘어난 만큼 대기 중인 작업을 깨움"""
+        old_limit = self.limit
+        self.current = min(self.max_limit, self.current + self.increase)
+        grown = self.limit - old_limit
+        if grown > 0 and self._cond is not None:
+            async with self._cond:
+                self._cond.notify(grown)
+
+    def on_backpressure(self, retry_after: float = None):
+        """429/5xx 감지 - 허용 동시 실행 수를 크게 줄이고 Retry-After 동안 새 작업 시작 보류"""
+        self.current = max(self.min_limit, self.current * self.decrease)
+        if retry_after:
+            self.pause_until = max(self.pause_until, time.monotonic() + retry_after)
+
+    async def acquire(self):
+        """실행 슬롯이 생길 때까지 대기"""
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+
+        while True:
+            pause = self.pause_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            async with self._cond:
+                await self._cond.wait_for(lambda: self._active < self.limit)
+                # 대기하는 동안 새로 보류가 걸렸으면 다시 기다림
+                if self.pause_until <= time.monotonic():
+                    self._active += 1
+                    return
+
+    async def release(self):
+        """실행 슬롯 반환"""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+        return None
+
+
+class Bucket:
+    """interval 초마다 token_limit 개의 요청만 실행하는 토큰 버킷 큐
+
+    토큰이 다 떨어지면 요청을 큐에 쌓아 두었다가 다음 구간이 시작될 때 순서대로 실행하므로
+    429를 받고 나서 물러나는 대신 미리 속도를 맞춥니다.
+
+    사용 예:
+        bucket = Bucket(5, 5)
+        await bucket.queue(lambda: channel.send(embed=embed))
+    """
+
+    def __init__(self, token_limit: int, interval: float):
+        if token_limit < 1 or interval <= 0:
+            raise ValueError("token_limit는 1 이상, interval은 0보다 커야 합니다.")
+
+        self.token_limit = token_limit
+        self.interval = interval
+        self.tokens = 0  # 현재 구간에서 사용한 토큰 수
+        self.last_reset = 0.0  # 현재 구간 시작 시각 (time.monotonic 기준)
+        self._queue = deque()  # (func, future)
+        self._timer = None  # 다음 구간에 check()를 다시 부르는 예약
+        self._running = set()  # 실행 중인 태스크 (완료 전 GC 방지용 참조 보관)
+
+    @property
+    def pending(self) -> int:
+        """토큰을 기다리는 요청 수"""
+        return len(self._queue)
+
+    def queue(self, func) -> asyncio.Future:
+        """func()가 돌려주는 코루틴을 토큰이 생기면 실행하고, 그 결과를 담을 Future 반환"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((func, future))
+        self.check()
+        return future
+
+    def check(self):
+        """구간이 지났으면 토큰을 채우고, 남은 토큰만큼 큐에서 꺼내 실행"""
+        if self._timer is not None:
+            return
+
+        now = time.monotonic()
+        if self.last_reset + self.interval <= now:
+            self.tokens = 0
+            self.last_reset = now
+
+        while self._queue and self.tokens < self.token_limit:
+            func, future = self._queue.popleft()
+            if future.cancelled():
+                continue
+            self.tokens += 1
+            self._start(func, future)
+
+        if self._queue:
+            delay = max(0.0, self.last_reset + self.interval - now)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self.check()
+
+    def _start(self, func, future):
+        try:
+            task = asyncio.ensure_future(func())
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        self._running.add(task)
+
+        def _done(t):
+            self._running.discard(t)
+            if future.cancelled():
+                if not t.cancelled():
+                    t.exception()  # 결과를 기다리는 쪽이 없어도 "exception was never retrieved" 경고 방지
+                return
+            if t.cancelled():
+                future.cancel()
+            elif t.exception() is not None:
+                future.set_exception(t.exception())
+            else:
+                future.set_result(t.result())
+
+        task.add_done_callback(_done)
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
 import discord
 from discord.ext import tasks
 import aiohttp
@@ -7,10 +8,19 @@ import os
 import time
 import re
 import csv
+import functools
+import io
+import random
+import logging
+import logging.handlers
+import queue
+import sys
+from pathlib import Path
 
 from queue_manager import queue_manager
 from exception_manager import exception_manager
-from utils import format_estimated_time, format_duration, format_time_until
+from utils import format_estimated_time, format_duration, format_time_until, TTLCache
+from rate_limiter import AsyncLimiter, Bucket, ConcurrencyController
 
 # database_manager import (데이터베이스 기능)
 try:
@@ -32,19 +42,24 @@ except ImportError:
         print("⚠️ auto_role_manager를 찾을 수 없어 기본 방식을 사용합니다.")
         
         class SimpleAutoRoleManager:
+            _cache = None  # (파일 수정 시간, 역할 목록) - 파일이 바뀌지 않으면 다시 읽지 않음
+
             def get_roles(self):
                 try:
-                    if os.path.exists("auto_roles.txt"):
-                        with open("auto_roles.txt", 'r') as f:
-                            roles = []
-                            for line in f:
-                                line = line.strip()
-                                if line.isdigit():
-                                    roles.append(int(line))
-                            return roles
-                    return []
+                    try:
+                        mtime = os.stat("auto_roles.txt").st_mtime
+                    except FileNotFoundError:
+                        return []
+
+                    if self._cache and self._cache[0] == mtime:
+                        return list(self._cache[1])
+
+                    with open("auto_roles.txt", 'r') as f:
+                        roles = [int(token) for token in f.read().split() if token.isdigit()]
+                    self._cache = (mtime, roles)
+                    return list(roles)
                 except Exception as e:
-                    print(f"❌ 역할 파일 읽기 실패: {e}")
+                    logger.error("❌ 역할 파일 읽기 실패: %s", e)
                     return []
         
         auto_role_manager = SimpleAutoRoleManager()
@@ -81,6 +96,7 @@ try:
     from config import config
     MC_API_BASE = config.MC_API_BASE
     BASE_NATION = config.BASE_NATION
+    BASE_NATION_UUID = config.BASE_NATION_UUID
     SUCCESS_ROLE_ID = config.SUCCESS_ROLE_ID
     SUCCESS_ROLE_ID_OUT = getattr(config, 'SUCCESS_ROLE_ID_OUT', 0)  # 외국인 역할 ID
     SUCCESS_CHANNEL_ID = config.SUCCESS_CHANNEL_ID
@@ -88,14 +104,19 @@ try:
     AUTO_EXECUTION_DAY = config.AUTO_EXECUTION_DAY
     AUTO_EXECUTION_HOUR = config.AUTO_EXECUTION_HOUR
     AUTO_EXECUTION_MINUTE = config.AUTO_EXECUTION_MINUTE
+    SCHEDULER_LOG_LEVEL = getattr(config, 'SCHEDULER_LOG_LEVEL', 'INFO')
+    SCHEDULER_PROFILE = getattr(config, 'SCHEDULER_PROFILE', False)
+    MC_API_REQUESTS_PER_MINUTE = getattr(config, 'MC_API_REQUESTS_PER_MINUTE', 10)
     print("✅ scheduler.py: config.py에서 환경변수 로드 완료")
     print(f"  - SUCCESS_ROLE_ID: {SUCCESS_ROLE_ID}")
     print(f"  - SUCCESS_ROLE_ID_OUT: {SUCCESS_ROLE_ID_OUT}")
 except ImportError:
     # config.py가 없으면 직접 환경변수 로드
     print("⚠️ config.py를 찾을 수 없어 직접 환경변수를 로드합니다.")
+    config = None
     MC_API_BASE = os.getenv("MC_API_BASE", "https://api.planetearth.kr")
     BASE_NATION = os.getenv("BASE_NATION", "Red_Mafia")
+    BASE_NATION_UUID = os.getenv("BASE_NATION_UUID")
     SUCCESS_ROLE_ID = int(os.getenv("SUCCESS_ROLE_ID", "0"))
     SUCCESS_ROLE_ID_OUT = int(os.getenv("SUCCESS_ROLE_ID_OUT", "0"))  # 외국인 역할 ID
     SUCCESS_CHANNEL_ID = int(os.getenv("SUCCESS_CHANNEL_ID", "0"))
@@ -103,19 +124,176 @@ except ImportError:
     AUTO_EXECUTION_DAY = int(os.getenv("AUTO_EXECUTION_DAY", "2"))
     AUTO_EXECUTION_HOUR = int(os.getenv("AUTO_EXECUTION_HOUR", "3"))
     AUTO_EXECUTION_MINUTE = int(os.getenv("AUTO_EXECUTION_MINUTE", "24"))
+    SCHEDULER_LOG_LEVEL = os.getenv("SCHEDULER_LOG_LEVEL", "INFO").upper()
+    SCHEDULER_PROFILE = os.getenv("SCHEDULER_PROFILE", "").lower() in ("true", "1", "yes", "on")
+    MC_API_REQUESTS_PER_MINUTE = int(os.getenv("MC_API_REQUESTS_PER_MINUTE", "10"))
     print(f"✅ scheduler.py: 직접 환경변수 로드 완료")
     print(f"  - SUCCESS_ROLE_ID: {SUCCESS_ROLE_ID}")
     print(f"  - SUCCESS_ROLE_ID_OUT: {SUCCESS_ROLE_ID_OUT}")
 
+# 스케줄러 로그 - 스케줄러가 실행 중일 때는 큐에 레코드만 추가하고, 포맷/출력은 백그라운드 스레드가 담당
+logger = logging.getLogger("scheduler")
+logger.setLevel(getattr(logging, str(SCHEDULER_LOG_LEVEL).upper(), logging.INFO))
+logger.propagate = False
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_queue = queue.SimpleQueue()
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener_running = False
+logger.addHandler(_log_stream_handler)  # 출력 스레드가 없을 때는 바로 출력
+
+def start_log_listener():
+    """로그 출력 스레드 시작 (이미 실행 중이면 무시)"""
+    global _log_listener_running
+
+    if not _log_listener_running:
+        _log_listener.start()
+        logger.removeHandler(_log_stream_handler)
+        logger.addHandler(_log_queue_handler)
+        _log_listener_running = True
+
+def stop_log_listener():
+    """로그 출력 스레드 종료 - 남은 레코드를 모두 출력한 뒤 바로 출력 방식으로 되돌림 (여러 번 호출해도 안전)"""
+    global _log_listener_running
+
+    if _log_listener_running:
+        _log_listener_running = False
+        logger.removeHandler(_log_queue_handler)
+        logger.addHandler(_log_stream_handler)
+        _log_listener.stop()
+
+# 코루틴 프로파일링 (SCHEDULER_PROFILE=true 일 때만 활성화, 비활성 시 데코레이터는 원본 함수를 그대로 반환)
+_profile_stats = {}  # 이름 -> [호출 수, 전체 시간, 실제 실행 시간]
+
+class _ProfiledCoroutine:
+    """코루틴을 한 단계씩 구동하며 실제 실행 시간과 await 대기 시간을 분리해 기록"""
+    __slots__ = ("_name", "_coro")
+
+    def __init__(self, name, coro):
+        self._name = name
+        self._coro = coro
+
+    def __await__(self):
+        it = self._coro.__await__()
+        active = 0.0
+        start = time.perf_counter()
+        value, exc = None, None
+        try:
+            while True:
+                step = time.perf_counter()
+                try:
+                    yielded = it.throw(exc) if exc is not None else it.send(value)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    active += time.perf_counter() - step
+                value, exc = None, None
+                try:
+                    value = yield yielded
+                except GeneratorExit:
+                    it.close()
+                    raise
+                except BaseException as e:
+                    exc = e
+        finally:
+            stats = _profile_stats.get(self._name)
+            if stats is None:
+                stats = _profile_stats[self._name] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += time.perf_counter() - start
+            stats[2] += active
+
+def profile_task(func):
+    """코루틴 함수의 호출 수/전체 시간/await 시간을 누적하는 데코레이터"""
+    if not SCHEDULER_PROFILE:
+        return func
+
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await _ProfiledCoroutine(name, func(*args, **kwargs))
+
+    return wrapper
+
+def get_profile_stats():
+    """프로파일 결과 반환 (전체 시간 내림차순) - 비활성 상태면 None"""
+    if not SCHEDULER_PROFILE:
+        return None
+
+    result = []
+    for name, (calls, total, active) in _profile_stats.items():
+        result.append({
+            "name": name,
+            "calls": calls,
+            "total": total,
+            "active": active,
+            "await": total - active,
+        })
+    result.sort(key=lambda item: item["total"], reverse=True)
+    return result
+
+def reset_profile_stats():
+    """누적된 프로파일 결과 초기화"""
+    _profile_stats.clear()
+
+# 자동 실행 시각 기준 시간대 (서버 시간대와 관계없이 한국 시간으로 예약)
+KST = timezone(timedelta(hours=9))
+
+# 요일 이름 및 자동 실행 스케줄 문자열 (설정값이 상수이므로 import 시 한 번만 계산)
+_DAY_NAMES = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
+_AUTO_DAY_NAME = _DAY_NAMES[AUTO_EXECUTION_DAY] if 0 <= AUTO_EXECUTION_DAY <= 6 else "알 수 없음"
+_AUTO_RUN_NEXT = f"매주 {_AUTO_DAY_NAME} {AUTO_EXECUTION_HOUR:02d}:{AUTO_EXECUTION_MINUTE:02d}"
+
 # 스케줄러 인스턴스
 # 봇 인스턴스 참조 저장
 _bot_instance = None
 
+# 대기열 처리용 HTTP 세션 (봇 수명 동안 재사용 - keep-alive로 TCP/TLS 연결 유지)
+_http_session = None
+
+# 대기열 처리 완료 감시 태스크
+_drain_task = None
+
+# 자동 역할 실행 스케줄러 태스크 및 다음 실행 시각
+_auto_roles_task = None
+_auto_roles_next_run = None
+
 # 429 오류 관리를 위한 전역 변수들
 rate_limit_detected = False  # 429 오류 감지 상태
-rate_limit_until = None      # 제한 해제 예상 시간
-retry_counts = {}            # 사용자별 재시도 횟수 추적
+rate_limit_until = None      # 제한 해제 예상 시각 (time.monotonic() 기준, 비교용)
+rate_limit_until_dt = None   # 제한 해제 예상 시간 (datetime, 표시용)
+RETRY_COUNT_TTL = 3600       # 재시도 기록 유지 시간 (초) - 지나면 자동 만료
+RETRY_TRACK_MAX = 10000      # 재시도 기록 최대 사용자 수 (초과 시 오래된 항목부터 제거)
+retry_counts = TTLCache(maxsize=RETRY_TRACK_MAX, ttl=RETRY_COUNT_TTL)  # 사용자별 재시도 횟수 추적
 MAX_RETRY_COUNT = 3          # 최대 재시도 횟수
+RATE_LIMIT_MAX_BACKOFF = 30  # 사용자별 재시도 지수 백오프 상한 (초)
+RATE_LIMIT_MIN_DELAY = 60    # Retry-After 헤더가 없을 때 전체 처리 중단 최소 시간 (초)
+RATE_LIMIT_MAX_DELAY = 300   # Retry-After 헤더가 없을 때 전체 처리 중단 최대 시간 (초)
+consecutive_rate_limits = 0  # 성공 응답 없이 연속으로 받은 429 횟수 (백오프 지수)
+rate_limit_delay = 0         # 마지막으로 적용한 대기 시간 (초, 알림 표시용)
+_rate_limit_lock = None      # 429 동시 처리용 락 (이벤트 루프 안에서 생성)
+RETRY_BACKOFF_BASE = 1.0     # 사용자별 재시도 백오프 기본값 (초)
+_next_eligible_at = TTLCache(maxsize=RETRY_TRACK_MAX, ttl=RETRY_COUNT_TTL)  # 사용자별 재시도 가능 시각 (time.monotonic() 기준)
+RESIDENT_CACHE_TTL = 300     # UUID → 게임 정보 캐시 유지 시간 (초)
+_resident_cache = TTLCache(maxsize=4096, ttl=RESIDENT_CACHE_TTL)
+
+# 마인크래프트 API 요청 속도 제한 (고정 sleep 대신 분당 허용량 안에서 몰아서 요청)
+# 기존 sleep 간격(요청 5초, 사용자 10초)이 분당 약 10회였으므로 기본값도 10회
+API_MAX_REQUESTS_PER_MINUTE = max(1, MC_API_REQUESTS_PER_MINUTE)
+_api_limiter = AsyncLimiter(API_MAX_REQUESTS_PER_MINUTE, 60)
+RATE_LIMITED_ERROR = "API 요청 한도에 도달했습니다. 잠시 후 다시 시도해주세요."
+
+# 1분 주기 배치 크기 - 사용자당 최대 2회 요청이므로 분당 한도의 절반이면 한 주기 안에 끝남
+API_BATCH_SIZE = max(1, API_MAX_REQUESTS_PER_MINUTE // 2)
+
+# Discord 역할/닉네임 변경 동시 처리 수 (429/5xx가 나오면 줄이고 성공하면 천천히 늘림)
+# 배치 안에서만 동시에 처리하므로 배치 크기를 넘을 수 없음
+_discord_concurrency = ConcurrencyController(min_limit=1, max_limit=API_BATCH_SIZE)
+
+# 로그 채널 메시지 토큰 버킷 (한도를 넘기 전에 미리 대기시켜 429를 피함)
+# 멤버 수정(역할/닉네임)은 discord.py의 경로별 속도 제한 처리에 맡김
+_log_message_bucket = Bucket(5, 5)     # 로그 채널 메시지 전송: 5초에 5회
 
 try:
     from alliance_manager import alliance_manager, is_friendly_nation, create_nation_role_if_needed
@@ -135,9 +313,31 @@ except ImportError as e:
     nation_role_manager = None
     NATION_ROLE_ENABLED = False
 
+def _build_town_role_index():
+    """마을 역할 매핑의 (매핑된 역할 ID 집합, 역할 ID → 마을 이름 튜플) 인덱스 반환 (매핑 변경 시에만 재계산)"""
+    if not (TOWN_ROLE_ENABLED and town_role_manager):
+        return frozenset(), {}
+
+    return town_role_manager.get_role_index()
+
+def _note_discord_error(error):
+    """Discord 요청 오류가 429/5xx면 동시 처리 제한기에 과부하 신호 전달"""
+    if isinstance(error, discord.RateLimited):
+        retry_after = error.retry_after
+    elif isinstance(error, discord.HTTPException) and (error.status == 429 or error.status >= 500):
+        headers = getattr(error.response, "headers", None) or {}
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+    else:
+        return
+
+    _discord_concurrency.on_backpressure(retry_after)
+    logger.warning("🚦 Discord 과부하 감지 - 동시 처리 %s명으로 축소", _discord_concurrency.limit)
+
 # update_user_info 함수 전체 (기존 함수를 완전히 대체)
 
-async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=None, town_uuid=None):
+@profile_task
+async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=None, town_uuid=None,
+                           town_role_index=None):
     """
     사용자 정보 업데이트 (역할, 닉네임) - UUID 기반 국가 역할 자동 생성 및 동맹 처리
 
@@ -149,10 +349,18 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
         town: 마을 이름 (선택)
         nation_uuid: 국가 UUID (선택, 우선순위 높음)
         town_uuid: 마을 UUID (선택)
+        town_role_index: _build_town_role_index() 결과 (선택, 없으면 직접 계산)
     """
     changes = []
 
     try:
+        # 보유 역할 ID 집합 (역할 보유 여부를 O(1)로 확인, 역할 변경 시 함께 갱신)
+        role_id_set = {r.id for r in member.roles}
+
+        # 역할 추가/제거는 role_id_set에만 반영해 두었다가 마지막에 한 번의 멤버 수정 요청으로 적용
+        original_role_ids = set(role_id_set)
+        role_changes = []  # (역할 ID, 문구) - 역할 변경이 적용되면 changes에 추가
+
         # 역할 양식 확인 (가장 높은 우선순위 역할)
         role_format = None
         applied_format_name = None
@@ -165,10 +373,10 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                     if format_str:
                         role_format = format_str
                         applied_format_name = role.name
-                        print(f"  🎭 역할 양식 적용: {role.name} - {format_str}")
+                        logger.info("  🎭 역할 양식 적용: %s - %s", role.name, format_str)
                         break
             except Exception as e:
-                print(f"  ⚠️ 역할 양식 확인 실패: {e}")
+                logger.warning("  ⚠️ 역할 양식 확인 실패: %s", e)
 
         # 새 닉네임 생성
         current_nickname = member.display_name
@@ -182,9 +390,9 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                 try:
                     user_callsign = callsign_manager.get_callsign(member.id)
                     if user_callsign:
-                        print(f"  🏷️ 콜사인 조회됨: {user_callsign}")
+                        logger.info("  🏷️ 콜사인 조회됨: %s", user_callsign)
                 except Exception as e:
-                    print(f"  ⚠️ 콜사인 조회 실패: {e}")
+                    logger.warning("  ⚠️ 콜사인 조회 실패: %s", e)
 
             # MC 정보가 없으면 ❌[ MC ] ❌로 표시
             display_mc_id = mc_id if mc_id else "❌[ MC ] ❌"
@@ -197,10 +405,10 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                 town=town,
                 callsign=user_callsign
             )
-            print(f"  🎭 역할 양식 적용됨: {new_nickname}")
+            logger.info("  🎭 역할 양식 적용됨: %s", new_nickname)
         else:
             # 역할 양식이 없으면 닉네임 변경하지 않음
-            print(f"  ℹ️ 역할 양식 없음 - 닉네임 변경 건너뜀")
+            logger.info("  ℹ️ 역할 양식 없음 - 닉네임 변경 건너뜀")
             new_nickname = None
 
         try:
@@ -210,56 +418,60 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                     changes.append(f"• 닉네임이 **``{new_nickname}``**로 변경됨 (🎭 {applied_format_name} 역할 양식)")
                 else:
                     changes.append(f"• 닉네임이 **``{new_nickname}``**로 변경됨")
-                print(f"  ✅ 닉네임 변경: {current_nickname} → {new_nickname}")
+                logger.info("  ✅ 닉네임 변경: %s → %s", current_nickname, new_nickname)
             else:
-                print(f"  ℹ️ 닉네임 유지: {new_nickname}")
+                logger.info("  ℹ️ 닉네임 유지: %s", new_nickname)
         except discord.Forbidden:
             changes.append("• ⚠️ 닉네임 변경 권한 없음")
-            print(f"  ⚠️ 닉네임 변경 권한 없음")
+            logger.warning("  ⚠️ 닉네임 변경 권한 없음")
         except Exception as e:
+            _note_discord_error(e)
             changes.append(f"• ⚠️ 닉네임 변경 실패: {str(e)[:50]}")
-            print(f"  ⚠️ 닉네임 변경 실패: {e}")
+            logger.warning("  ⚠️ 닉네임 변경 실패: %s", e)
 
         # 매핑된 마을 역할 처리 (무소속 제외)
         if TOWN_ROLE_ENABLED and town_role_manager:
             try:
-                # 1. 먼저 기존 마을 역할들을 모두 제거
-                all_mapped_towns = town_role_manager.get_all_mappings_flat()
-                for mapping in all_mapped_towns:
-                    mapped_town = mapping['town_name']
-                    mapped_role_id = mapping['role_id']
-                    if mapped_town != town:  # 현재 마을이 아닌 역할들만
-                        mapped_role = guild.get_role(mapped_role_id)
-                        if mapped_role and mapped_role in member.roles:
-                            await member.remove_roles(mapped_role)
-                            changes.append(f"• **{mapped_town}** 마을 역할 제거됨 (마을 변경)")
-                            print(f"  ✅ 이전 마을 역할 제거: {mapped_town}")
+                mapped_role_ids, town_names_by_id = town_role_index or _build_town_role_index()
 
-                # 2. 새 마을 역할 부여 (무소속이 아닌 경우)
+                # 현재 마을의 역할 ID (무소속/정보없음이면 None)
+                role_id = None
                 if town and town != "무소속" and town != "❌":
                     role_id = town_role_manager.get_role_id_by_name(town)
+
+                # 1. 먼저 기존 마을 역할들을 모두 제거 (보유 역할 ∩ 매핑된 역할 - 현재 마을 역할)
+                for stale_role_id in (role_id_set & mapped_role_ids) - {role_id}:
+                    mapped_role = guild.get_role(stale_role_id)
+                    if mapped_role:
+                        mapped_town = ", ".join(town_names_by_id[stale_role_id])
+                        role_id_set.discard(stale_role_id)
+                        role_changes.append((stale_role_id, f"• **{mapped_town}** 마을 역할 제거됨 (마을 변경)"))
+                        logger.info("  ✅ 이전 마을 역할 제거 예정: %s", mapped_town)
+
+                # 2. 새 마을 역할 부여 (무소속이 아닌 경우)
+                if town and town != "무소속" and town != "❌":
                     if role_id:
                         town_role = guild.get_role(role_id)
                         if town_role:
-                            if town_role not in member.roles:
-                                await member.add_roles(town_role)
-                                changes.append(f"• **{town}** 마을 역할 추가됨")
-                                print(f"  ✅ 매핑된 마을 역할 부여: {town}")
+                            if town_role.id not in role_id_set:
+                                role_id_set.add(town_role.id)
+                                role_changes.append((town_role.id, f"• **{town}** 마을 역할 추가됨"))
+                                logger.info("  ✅ 매핑된 마을 역할 부여 예정: %s", town)
                             else:
-                                print(f"  ℹ️ 이미 마을 역할 보유: {town}")
+                                logger.info("  ℹ️ 이미 마을 역할 보유: %s", town)
                         else:
                             changes.append(f"• ⚠️ 마을 역할을 찾을 수 없음 (ID: {role_id})")
-                            print(f"  ⚠️ 마을 역할 없음: {role_id}")
+                            logger.warning("  ⚠️ 마을 역할 없음: %s", role_id)
                     else:
-                        print(f"  ℹ️ `{town}` 마을은 역할이 매핑되지 않음")
+                        logger.info("  ℹ️ `%s` 마을은 역할이 매핑되지 않음", town)
                 elif town == "무소속" or town == "❌":
-                    print(f"  ℹ️ 무소속/정보없음 사용자 - 마을 역할 모두 제거됨")
+                    logger.info("  ℹ️ 무소속/정보없음 사용자 - 마을 역할 모두 제거됨")
 
             except Exception as e:
                 changes.append(f"• ⚠️ 마을 역할 처리 실패: {str(e)[:50]}")
-                print(f"  ⚠️ 마을 역할 처리 실패: {e}")
+                logger.warning("  ⚠️ 마을 역할 처리 실패: %s", e)
         elif town and not TOWN_ROLE_ENABLED:
-            print(f"  ℹ️ `{town}` 마을 - 마을 역할 기능 비활성화됨")
+            logger.info("  ℹ️ `%s` 마을 - 마을 역할 기능 비활성화됨", town)
 
         # 국가 역할 변경 시 이전 국가 역할 제거
         if NATION_ROLE_ENABLED and nation_role_manager:
@@ -270,24 +482,22 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                 for nation_name, role_data in all_nation_mappings.items():
                     if nation_name != nation:  # 현재 국가가 아닌 역할들만
                         old_role = guild.get_role(role_data['role_id'])
-                        if old_role and old_role in member.roles:
-                            await member.remove_roles(old_role)
-                            changes.append(f"• **{nation_name}** 국가 역할 제거됨 (국가 변경)")
-                            print(f"  ✅ 이전 국가 역할 제거: {nation_name}")
+                        if old_role and old_role.id in role_id_set:
+                            role_id_set.discard(old_role.id)
+                            role_changes.append((old_role.id, f"• **{nation_name}** 국가 역할 제거됨 (국가 변경)"))
+                            logger.info("  ✅ 이전 국가 역할 제거 예정: %s", nation_name)
 
             except Exception as e:
-                print(f"  ⚠️ 이전 국가 역할 제거 실패: {e}")
+                logger.warning("  ⚠️ 이전 국가 역할 확인 실패: %s", e)
 
         # 국가별 역할 부여 (UUID 기반 로직)
-        try:
-            from config import config
-            from alliance_manager import is_friendly_nation as check_friendly
-
-            base_nation = getattr(config, 'BASE_NATION', 'Red_Mafia')
-            base_nation_uuid = getattr(config, 'BASE_NATION_UUID', None)
-        except:
-            base_nation = 'Red_Mafia'
-            base_nation_uuid = None
+        # 기본 국가는 관리자 명령으로 실행 중에 바뀔 수 있으므로 모듈에 로드된 config 객체에서 바로 읽음
+        if config is not None:
+            base_nation = config.BASE_NATION
+            base_nation_uuid = config.BASE_NATION_UUID
+        else:
+            base_nation = BASE_NATION
+            base_nation_uuid = BASE_NATION_UUID
 
         # 우호 국가 확인 (UUID 우선, 이름 fallback)
         is_base_nation = False
@@ -308,42 +518,34 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
 
         # 디버그 로그
         if nation_uuid:
-            print(f"  🔍 UUID 기반 국가 확인: {nation} (UUID: {nation_uuid[:8]}...)")
+            logger.info("  🔍 UUID 기반 국가 확인: %s (UUID: %s...)", nation, nation_uuid[:8])
         else:
-            print(f"  🔍 이름 기반 국가 확인: {nation} (UUID 없음)")
+            logger.info("  🔍 이름 기반 국가 확인: %s (UUID 없음)", nation)
         
         if is_base_nation:
             # 기본 국가(BASE_NATION) 국민 - 조직원 역할 부여
-            print(f"  🏠 {base_nation} 기본 국가 국민 확인됨")
+            logger.info("  🏠 %s 기본 국가 국민 확인됨", base_nation)
 
             # 조직원 역할(SUCCESS_ROLE_ID) 부여
             if SUCCESS_ROLE_ID != 0:
                 success_role = guild.get_role(SUCCESS_ROLE_ID)
                 if success_role:
-                    if success_role not in member.roles:
-                        try:
-                            await member.add_roles(success_role)
-                            changes.append(f"• **{success_role.name}** 역할 추가됨")
-                            print(f"  ✅ 조직원 역할 부여: {success_role.name}")
-                        except Exception as e:
-                            changes.append(f"• ⚠️ 조직원 역할 부여 실패: {str(e)[:50]}")
-                            print(f"  ⚠️ 조직원 역할 부여 실패: {e}")
+                    if success_role.id not in role_id_set:
+                        role_id_set.add(success_role.id)
+                        role_changes.append((success_role.id, f"• **{success_role.name}** 역할 추가됨"))
+                        logger.info("  ✅ 조직원 역할 부여 예정: %s", success_role.name)
                     else:
-                        print(f"  ℹ️ 이미 조직원 역할 보유: {success_role.name}")
+                        logger.info("  ℹ️ 이미 조직원 역할 보유: %s", success_role.name)
                 else:
-                    print(f"  ⚠️ 조직원 역할을 찾을 수 없음 (ID: {SUCCESS_ROLE_ID})")
+                    logger.warning("  ⚠️ 조직원 역할을 찾을 수 없음 (ID: %s)", SUCCESS_ROLE_ID)
 
             # 외국인 역할 제거
             if SUCCESS_ROLE_ID_OUT != 0:
                 out_role = guild.get_role(SUCCESS_ROLE_ID_OUT)
-                if out_role and out_role in member.roles:
-                    try:
-                        await member.remove_roles(out_role)
-                        changes.append(f"• **{out_role.name}** 역할 제거됨")
-                        print(f"  ✅ 외국인 역할 제거: {out_role.name}")
-                    except Exception as e:
-                        changes.append(f"• ⚠️ 외국인 역할 제거 실패: {str(e)[:50]}")
-                        print(f"  ⚠️ 외국인 역할 제거 실패: {e}")
+                if out_role and out_role.id in role_id_set:
+                    role_id_set.discard(out_role.id)
+                    role_changes.append((out_role.id, f"• **{out_role.name}** 역할 제거됨"))
+                    logger.info("  ✅ 외국인 역할 제거 예정: %s", out_role.name)
 
             # 기본 국가도 국가별 역할 부여 (선택사항)
             if nation != "무소속":
@@ -351,49 +553,42 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                     nation_role = await create_nation_role_if_needed(guild, nation)
 
                     if nation_role:
-                        if nation_role not in member.roles:
-                            await member.add_roles(nation_role)
-                            changes.append(f"• **{nation_role.name}** 국가 역할 추가됨")
-                            print(f"  ✅ 기본 국가 역할 부여: {nation_role.name}")
+                        if nation_role.id not in role_id_set:
+                            role_id_set.add(nation_role.id)
+                            role_changes.append((nation_role.id, f"• **{nation_role.name}** 국가 역할 추가됨"))
+                            logger.info("  ✅ 기본 국가 역할 부여 예정: %s", nation_role.name)
                         else:
-                            print(f"  ℹ️ 이미 기본 국가 역할 보유: {nation_role.name}")
+                            logger.info("  ℹ️ 이미 기본 국가 역할 보유: %s", nation_role.name)
 
                 except Exception as e:
+                    _note_discord_error(e)
                     changes.append(f"• ⚠️ 국가 역할 처리 실패: {str(e)[:50]}")
-                    print(f"  ⚠️ 국가 역할 처리 실패 ({nation}): {e}")
+                    logger.warning("  ⚠️ 국가 역할 처리 실패 (%s): %s", nation, e)
 
         elif is_alliance_nation:
             # 동맹 국가 국민 - 외국인 역할 + 국가별 역할 부여
-            print(f"  🤝 {nation} 동맹 국가 국민 확인됨")
+            logger.info("  🤝 %s 동맹 국가 국민 확인됨", nation)
 
             # 외국인 역할(SUCCESS_ROLE_ID_OUT) 부여
             if SUCCESS_ROLE_ID_OUT != 0:
                 out_role = guild.get_role(SUCCESS_ROLE_ID_OUT)
                 if out_role:
-                    if out_role not in member.roles:
-                        try:
-                            await member.add_roles(out_role)
-                            changes.append(f"• **{out_role.name}** 역할 추가됨 (동맹)")
-                            print(f"  ✅ 외국인 역할 부여: {out_role.name}")
-                        except Exception as e:
-                            changes.append(f"• ⚠️ 외국인 역할 부여 실패: {str(e)[:50]}")
-                            print(f"  ⚠️ 외국인 역할 부여 실패: {e}")
+                    if out_role.id not in role_id_set:
+                        role_id_set.add(out_role.id)
+                        role_changes.append((out_role.id, f"• **{out_role.name}** 역할 추가됨 (동맹)"))
+                        logger.info("  ✅ 외국인 역할 부여 예정: %s", out_role.name)
                     else:
-                        print(f"  ℹ️ 이미 외국인 역할 보유: {out_role.name}")
+                        logger.info("  ℹ️ 이미 외국인 역할 보유: %s", out_role.name)
                 else:
-                    print(f"  ⚠️ 외국인 역할을 찾을 수 없음 (ID: {SUCCESS_ROLE_ID_OUT})")
+                    logger.warning("  ⚠️ 외국인 역할을 찾을 수 없음 (ID: %s)", SUCCESS_ROLE_ID_OUT)
 
             # 조직원 역할 제거
             if SUCCESS_ROLE_ID != 0:
                 success_role = guild.get_role(SUCCESS_ROLE_ID)
-                if success_role and success_role in member.roles:
-                    try:
-                        await member.remove_roles(success_role)
-                        changes.append(f"• **{success_role.name}** 역할 제거됨")
-                        print(f"  ✅ 조직원 역할 제거: {success_role.name}")
-                    except Exception as e:
-                        changes.append(f"• ⚠️ 조직원 역할 제거 실패: {str(e)[:50]}")
-                        print(f"  ⚠️ 조직원 역할 제거 실패: {e}")
+                if success_role and success_role.id in role_id_set:
+                    role_id_set.discard(success_role.id)
+                    role_changes.append((success_role.id, f"• **{success_role.name}** 역할 제거됨"))
+                    logger.info("  ✅ 조직원 역할 제거 예정: %s", success_role.name)
 
             # 동맹 국가별 역할 부여
             if nation != "무소속":
@@ -402,58 +597,51 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                     nation_role = await create_nation_role_if_needed(guild, nation)
 
                     if nation_role:
-                        if nation_role not in member.roles:
-                            await member.add_roles(nation_role)
-                            changes.append(f"• **{nation_role.name}** 국가 역할 추가됨")
-                            print(f"  ✅ 동맹 국가 역할 부여: {nation_role.name}")
+                        if nation_role.id not in role_id_set:
+                            role_id_set.add(nation_role.id)
+                            role_changes.append((nation_role.id, f"• **{nation_role.name}** 국가 역할 추가됨"))
+                            logger.info("  ✅ 동맹 국가 역할 부여 예정: %s", nation_role.name)
                         else:
-                            print(f"  ℹ️ 이미 국가 역할 보유: {nation_role.name}")
+                            logger.info("  ℹ️ 이미 국가 역할 보유: %s", nation_role.name)
                     else:
                         changes.append(f"• ⚠️ {nation} 국가 역할 생성/부여 실패")
-                        print(f"  ⚠️ {nation} 국가 역할 처리 실패")
+                        logger.warning("  ⚠️ %s 국가 역할 처리 실패", nation)
 
                 except Exception as e:
+                    _note_discord_error(e)
                     changes.append(f"• ⚠️ 국가 역할 처리 실패: {str(e)[:50]}")
-                    print(f"  ⚠️ 국가 역할 처리 실패 ({nation}): {e}")
+                    logger.warning("  ⚠️ 국가 역할 처리 실패 (%s): %s", nation, e)
             
         else:
             # 외국인 또는 무소속
             if nation == "무소속":
-                print(f"  🌍 무소속 사용자 확인됨 - 외국인 역할 부여")
+                logger.info("  🌍 무소속 사용자 확인됨 - 외국인 역할 부여")
             else:
-                print(f"  🌍 외국인 확인됨: {nation}")
+                logger.info("  🌍 외국인 확인됨: %s", nation)
             
             # 외국인 역할 부여
             if SUCCESS_ROLE_ID_OUT != 0:
                 out_role = guild.get_role(SUCCESS_ROLE_ID_OUT)
                 if out_role:
-                    if out_role not in member.roles:
-                        try:
-                            await member.add_roles(out_role)
-                            if nation == "무소속":
-                                changes.append(f"• **{out_role.name}** 역할 추가됨 (무소속)")
-                            else:
-                                changes.append(f"• **{out_role.name}** 역할 추가됨")
-                            print(f"  ✅ 외국인 역할 부여: {out_role.name}")
-                        except Exception as e:
-                            changes.append(f"• ⚠️ 외국인 역할 부여 실패: {str(e)[:50]}")
-                            print(f"  ⚠️ 외국인 역할 부여 실패: {e}")
+                    if out_role.id not in role_id_set:
+                        role_id_set.add(out_role.id)
+                        if nation == "무소속":
+                            role_changes.append((out_role.id, f"• **{out_role.name}** 역할 추가됨 (무소속)"))
+                        else:
+                            role_changes.append((out_role.id, f"• **{out_role.name}** 역할 추가됨"))
+                        logger.info("  ✅ 외국인 역할 부여 예정: %s", out_role.name)
                     else:
-                        print(f"  ℹ️ 이미 외국인 역할 보유: {out_role.name}")
+                        logger.info("  ℹ️ 이미 외국인 역할 보유: %s", out_role.name)
                 else:
-                    print(f"  ⚠️ 외국인 역할을 찾을 수 없음 (ID: {SUCCESS_ROLE_ID_OUT})")
+                    logger.warning("  ⚠️ 외국인 역할을 찾을 수 없음 (ID: %s)", SUCCESS_ROLE_ID_OUT)
             
             # 국민 역할 제거
             if SUCCESS_ROLE_ID != 0:
                 success_role = guild.get_role(SUCCESS_ROLE_ID)
-                if success_role and success_role in member.roles:
-                    try:
-                        await member.remove_roles(success_role)
-                        changes.append(f"• **{success_role.name}** 역할 제거됨")
-                        print(f"  ✅ 국민 역할 제거: {success_role.name}")
-                    except Exception as e:
-                        changes.append(f"• ⚠️ 국민 역할 제거 실패: {str(e)[:50]}")
-                        print(f"  ⚠️ 국민 역할 제거 실패: {e}")
+                if success_role and success_role.id in role_id_set:
+                    role_id_set.discard(success_role.id)
+                    role_changes.append((success_role.id, f"• **{success_role.name}** 역할 제거됨"))
+                    logger.info("  ✅ 국민 역할 제거 예정: %s", success_role.name)
             
             # 외국인 국가에도 국가별 역할 부여 (선택사항)
             if nation != "무소속":
@@ -462,21 +650,59 @@ async def update_user_info(member, mc_id, nation, guild, town=None, nation_uuid=
                     nation_role = await create_nation_role_if_needed(guild, nation)
                     
                     if nation_role:
-                        if nation_role not in member.roles:
-                            await member.add_roles(nation_role)
-                            changes.append(f"• **{nation_role.name}** 외국 국가 역할 추가됨")
-                            print(f"  ✅ 외국 국가 역할 부여: {nation_role.name}")
+                        if nation_role.id not in role_id_set:
+                            role_id_set.add(nation_role.id)
+                            role_changes.append((nation_role.id, f"• **{nation_role.name}** 외국 국가 역할 추가됨"))
+                            logger.info("  ✅ 외국 국가 역할 부여 예정: %s", nation_role.name)
                         else:
-                            print(f"  ℹ️ 이미 외국 국가 역할 보유: {nation_role.name}")
+                            logger.info("  ℹ️ 이미 외국 국가 역할 보유: %s", nation_role.name)
                             
                 except Exception as e:
+                    _note_discord_error(e)
                     changes.append(f"• ⚠️ 외국 국가 역할 처리 실패: {str(e)[:50]}")
-                    print(f"  ⚠️ 외국 국가 역할 처리 실패 ({nation}): {e}")
+                    logger.warning("  ⚠️ 외국 국가 역할 처리 실패 (%s): %s", nation, e)
+
+        # 모아 둔 역할 변경을 한 번의 요청으로 적용 (역할마다 add_roles/remove_roles 호출하지 않음)
+        if role_id_set != original_role_ids:
+            roles_to_add = role_id_set - original_role_ids
+            roles_to_remove = original_role_ids - role_id_set
+
+            # 봇보다 높거나 연동(managed) 역할은 바꿀 수 없으므로 제외 - 하나 때문에 나머지 변경이 모두 실패하지 않도록
+            skipped_ids = set()
+            skipped_roles = []
+            for rid in roles_to_add | roles_to_remove:
+                role = guild.get_role(rid)
+                if role is None or not role.is_assignable():
+                    skipped_ids.add(rid)
+                    skipped_roles.append(role.name if role else str(rid))
+            roles_to_add -= skipped_ids
+            roles_to_remove -= skipped_ids
+            if skipped_roles:
+                changes.append(f"• ⚠️ 봇 권한 부족으로 건너뛴 역할: {', '.join(skipped_roles)}")
+                logger.warning("  ⚠️ 봇 권한 부족으로 건너뛴 역할: %s", ", ".join(skipped_roles))
+
+            try:
+                # API 조회 동안 다른 곳에서 바뀐 역할을 덮어쓰지 않도록, 요청 직전의 역할에 변경분만 적용
+                current_ids = {r.id for r in member.roles}
+                new_ids = (current_ids | roles_to_add) - roles_to_remove
+                if new_ids != current_ids:
+                    new_ids.discard(guild.default_role.id)
+                    await member.edit(roles=[discord.Object(id=rid) for rid in new_ids], reason="자동 역할 동기화")
+                changes.extend(text for rid, text in role_changes if rid not in skipped_ids)
+                logger.info("  ✅ 역할 변경 적용: +%d / -%d", len(roles_to_add), len(roles_to_remove))
+            except discord.Forbidden:
+                changes.append("• ⚠️ 역할 변경 권한 없음")
+                logger.warning("  ⚠️ 역할 변경 권한 없음")
+            except Exception as e:
+                _note_discord_error(e)
+                changes.append(f"• ⚠️ 역할 변경 실패: {str(e)[:50]}")
+                logger.warning("  ⚠️ 역할 변경 실패: %s", e)
         
         return changes
         
     except Exception as e:
-        print(f"❌ 사용자 정보 업데이트 실패: {e}")
+        _note_discord_error(e)
+        logger.error("❌ 사용자 정보 업데이트 실패: %s", e)
         return [f"• ❌ 업데이트 실패: {str(e)[:50]}"]
 
 
@@ -510,20 +736,34 @@ def is_exception_user(user_id: int) -> bool:
     try:
         return exception_manager.is_exception(user_id)
     except Exception as e:
-        print(f"⚠️ 예외 사용자 확인 오류: {e}")
+        logger.warning("⚠️ 예외 사용자 확인 오류: %s", e)
         return False
 
 def setup_scheduler(bot):
     """스케줄러 설정 함수 (main.py에서 호출) - 누락된 함수 추가"""
-    print("🔧 스케줄러 설정 시작...")
+    logger.info("🔧 스케줄러 설정 시작...")
     start_scheduler(bot)
 
+# get_scheduler_info에서 사용하는 작업 정보 템플릿 (호출 시 복사해서 사용)
+_QUEUE_JOB_TEMPLATE = {
+    "id": "queue_processor",
+    "name": "대기열 처리",
+    "next_run": None,
+    "interval": "1분마다"
+}
+_AUTO_ROLES_JOB_TEMPLATE = {
+    "id": "auto_roles_scheduler",
+    "name": "자동 역할 실행",
+    "next_run": _AUTO_RUN_NEXT,
+    "interval": "매주 1회 (실행 시각 예약)"
+}
+
 def get_scheduler_info():
     """백그라운드 태스크 상태 정보를 반환 (discord.ext.tasks 기반)"""
     try:
         # 백그라운드 루프 실행 상태
         queue_running = queue_processor_loop.is_running()
-        auto_roles_running = auto_roles_checker.is_running()
+        auto_roles_running = _auto_roles_task is not None and not _auto_roles_task.done()
 
         # 등록된 작업들
         jobs = []
@@ -535,23 +775,15 @@ def get_scheduler_info():
             else:
                 next_run = "곧 실행"
 
-            jobs.append({
-                "id": "queue_processor",
-                "name": "대기열 처리",
-                "next_run": next_run,
-                "interval": "1분마다"
-            })
+            queue_job = _QUEUE_JOB_TEMPLATE.copy()
+            queue_job["next_run"] = next_run
+            jobs.append(queue_job)
 
         if auto_roles_running:
-            day_names = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
-            day_name = day_names[AUTO_EXECUTION_DAY] if 0 <= AUTO_EXECUTION_DAY <= 6 else "알 수 없음"
-
-            jobs.append({
-                "id": "auto_roles_checker",
-                "name": "자동 역할 실행",
-                "next_run": f"매주 {day_name} {AUTO_EXECUTION_HOUR:02d}:{AUTO_EXECUTION_MINUTE:02d}",
-                "interval": "1시간마다 체크"
-            })
+            auto_roles_job = _AUTO_ROLES_JOB_TEMPLATE.copy()
+            if _auto_roles_next_run:
+                auto_roles_job["next_run"] = _auto_roles_next_run.strftime("%Y-%m-%d %H:%M:%S")
+            jobs.append(auto_roles_job)
 
         # 상태 정보
         status_info = {
@@ -563,13 +795,13 @@ def get_scheduler_info():
             "auto_execution_hour": AUTO_EXECUTION_HOUR,
             "auto_execution_minute": AUTO_EXECUTION_MINUTE,
             "rate_limit_detected": rate_limit_detected,
-            "rate_limit_until": rate_limit_until.strftime("%Y-%m-%d %H:%M:%S") if rate_limit_until else None,
+            "rate_limit_until": rate_limit_until_dt.strftime("%Y-%m-%d %H:%M:%S") if rate_limit_until_dt else None,
             "retry_queue_size": len(retry_counts)
         }
 
         return status_info
     except Exception as e:
-        print(f"백그라운드 태스크 정보 조회 오류: {e}")
+        logger.error("백그라운드 태스크 정보 조회 오류: %s", e)
         return {
             "running": False,
             "queue_loop_running": False,
@@ -585,32 +817,97 @@ def get_scheduler_info():
     
 
 
-def handle_rate_limit():
-    """429 오류 감지 시 호출되는 함수"""
-    global rate_limit_detected, rate_limit_until
+def _parse_retry_after(value):
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 변환 - 해석 불가 시 None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+def handle_rate_limit(response=None):
+    """429 오류 감지 시 호출되는 함수 - Retry-After 헤더 우선, 없으면 연속 429 횟수 기준 지수 백오프 (지터 포함)"""
+    global rate_limit_detected, rate_limit_until, rate_limit_until_dt, rate_limit_delay, consecutive_rate_limits
+
+    consecutive_rate_limits += 1
+    retry_after = _parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+    if retry_after is not None:
+        delay = retry_after
+    else:
+        backoff = RATE_LIMIT_MIN_DELAY * 2 ** (consecutive_rate_limits - 1) * (1 + random.random() * 0.5)
+        delay = min(RATE_LIMIT_MAX_DELAY, backoff)
 
     rate_limit_detected = True
-    rate_limit_until = datetime.now() + timedelta(minutes=5)
-    rate_limit_unix = int(rate_limit_until.timestamp())
+    rate_limit_delay = delay
+    rate_limit_until = time.monotonic() + delay
+    rate_limit_until_dt = datetime.now() + timedelta(seconds=delay)
+    rate_limit_unix = int(rate_limit_until_dt.timestamp())
 
-    print(f"🚨 API 속도 제한 감지! 5분간 대기 ({rate_limit_until.strftime('%H:%M:%S')}까지, Unix: {rate_limit_unix})")
+    source = "Retry-After" if retry_after is not None else f"연속 {consecutive_rate_limits}회차 백오프"
+    logger.warning("🚨 API 속도 제한 감지! %.0f초간 대기 (%s, %s까지, Unix: %s)", delay, source, rate_limit_until_dt.strftime('%H:%M:%S'), rate_limit_unix)
 
 def is_rate_limited() -> bool:
     """현재 API 속도 제한 상태인지 확인"""
-    global rate_limit_detected, rate_limit_until
-    
-    if not rate_limit_detected:
+    global rate_limit_detected, rate_limit_until, rate_limit_until_dt
+
+    if rate_limit_until is None:
         return False
-    
-    if datetime.now() >= rate_limit_until:
+
+    if time.monotonic() >= rate_limit_until:
         # 제한 시간이 지났으면 상태 초기화
         rate_limit_detected = False
         rate_limit_until = None
-        print("✅ API 속도 제한 해제")
+        rate_limit_until_dt = None
+        logger.info("✅ API 속도 제한 해제")
         return False
     
     return True
 
+def _note_api_success():
+    """429가 아닌 응답을 받으면 연속 429 횟수 초기화"""
+    global consecutive_rate_limits
+    consecutive_rate_limits = 0
+
+async def _acquire_api_slot(user_id: int, priority: bool = False, requeue: bool = True) -> bool:
+    """API 요청 슬롯 확보 - 대기하는 동안 속도 제한이 걸렸으면 False 반환
+
+    priority=True면 대기열 배치보다 먼저 슬롯을 받고, requeue=True(대기열에서 온 요청)일 때만 재대기열에 추가
+    """
+    await _api_limiter.acquire(priority=priority)
+    if is_rate_limited():
+        if requeue:
+            queue_manager.add_user(user_id)
+            logger.info("  ⏸️ 속도 제한 중 - 요청 없이 재대기열 추가: %s", user_id)
+        else:
+            logger.info("  ⏸️ 속도 제한 중 - 요청 중단: %s", user_id)
+        return False
+    return True
+
+async def _report_rate_limit(bot, response, user_id: int):
+    """429 응답 처리 - 동시에 여러 요청이 429를 받아도 제한 설정과 알림은 한 번만"""
+    global _rate_limit_lock
+
+    if _rate_limit_lock is None:
+        _rate_limit_lock = asyncio.Lock()
+
+    async with _rate_limit_lock:
+        if is_rate_limited():
+            return
+        handle_rate_limit(response)
+        await send_rate_limit_notification(bot)
+
+def _schedule_retry(user_id: int, attempt: int):
+    """사용자별 지수 백오프(지터 포함) 후 재시도하도록 대기열에 재추가"""
+    delay = min(RATE_LIMIT_MAX_BACKOFF, RETRY_BACKOFF_BASE * 2 ** attempt) * (1 + random.random() * 0.5)
+    _next_eligible_at[user_id] = time.monotonic() + delay
+    queue_manager.add_user(user_id)
+
 def increment_retry_count(user_id: int) -> int:
     """사용자의 재시도 횟수를 증가시키고 반환"""
     retry_counts[user_id] = retry_counts.get(user_id, 0) + 1
@@ -706,101 +1003,171 @@ def create_nickname(mc_id: str, nation: str, current_nickname: str = None, town:
 
     return abbreviated_nickname
 
-# 글로벌 CSV 데이터 수집 리스트 및 자동 실행 플래그
-_csv_data_collection = []
+# CSV 보고서 설정 (data/csv_exports 폴더)
+CSV_EXPORT_DIR = "data/csv_exports"
+CSV_FIELDNAMES = [
+    'discord_id',
+    'discord_name',
+    'minecraft_name',
+    'minecraft_uuid',
+    'nation',
+    'town',
+    'nation_ranks',
+    'town_ranks',
+    'last_online_timestamp',
+    'last_online_date',
+    'days_offline',
+    'processed_at'
+]
+CSV_FLUSH_INTERVAL = 20  # N건마다 디스크에 flush (중단 시에도 진행분 보존)
+
+# 글로벌 CSV 스트리밍 writer 및 자동 실행 플래그
+_csv_file = None
+_csv_writer = None
+_csv_filepath = None
+_csv_row_count = 0
 _is_auto_execution = False  # 스케줄러 자동 실행 여부
 
+def _open_csv_writer():
+    """CSV 파일을 열고 헤더를 기록 (첫 데이터가 들어올 때 한 번만 호출)"""
+    global _csv_file, _csv_writer, _csv_filepath, _csv_row_count
+
+    os.makedirs(CSV_EXPORT_DIR, exist_ok=True)
+
+    # 파일명: auto_execution_YYYYMMDD_HHMMSS.csv
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    _csv_filepath = os.path.join(CSV_EXPORT_DIR, f"auto_execution_{timestamp}.csv")
+
+    _csv_file = open(_csv_filepath, 'w', newline='', encoding='utf-8-sig')
+    _csv_writer = csv.DictWriter(_csv_file, fieldnames=CSV_FIELDNAMES)
+    _csv_writer.writeheader()
+    _csv_row_count = 0
+    logger.info("📋 CSV 보고서 작성 시작: %s", _csv_filepath)
+
 def add_to_csv_collection(user_data: dict):
-    """CSV 데이터 수집 리스트에 사용자 정보 추가 (자동 실행 시에만)"""
-    global _csv_data_collection, _is_auto_execution
+    """사용자 정보를 CSV 파일에 바로 기록 (자동 실행 시에만)"""
+    global _csv_row_count
 
     # 자동 실행 중일 때만 CSV 데이터 수집
-    if _is_auto_execution:
-        _csv_data_collection.append(user_data)
-    else:
-        # 자동 실행이 아닐 때는 수집하지 않음
-        pass
+    if not _is_auto_execution:
+        return
 
-def save_csv_report():
-    """수집된 데이터를 CSV 파일로 저장 (data/csv_exports 폴더)"""
-    global _csv_data_collection
+    if _csv_writer is None:
+        _open_csv_writer()
 
-    try:
-        if not _csv_data_collection:
-            print("📋 CSV 저장: 데이터 없음")
-            return None
-
-        # data/csv_exports 폴더 생성
-        csv_dir = "data/csv_exports"
-        os.makedirs(csv_dir, exist_ok=True)
-
-        # 파일명: auto_execution_YYYYMMDD_HHMMSS.csv
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"auto_execution_{timestamp}.csv"
-        filepath = os.path.join(csv_dir, filename)
-
-        # CSV 헤더
-        fieldnames = [
-            'discord_id',
-            'discord_name',
-            'minecraft_name',
-            'minecraft_uuid',
-            'nation',
-            'town',
-            'nation_ranks',
-            'town_ranks',
-            'last_online_timestamp',
-            'last_online_date',
-            'days_offline',
-            'processed_at'
-        ]
+    _csv_writer.writerow(user_data)
+    _csv_row_count += 1
 
-        # CSV 파일 생성
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(_csv_data_collection)
+    if _csv_row_count % CSV_FLUSH_INTERVAL == 0:
+        _csv_file.flush()
 
-        print(f"✅ CSV 보고서 저장 완료: {filepath} ({len(_csv_data_collection)}건)")
+async def save_csv_report():
+    """작성 중인 CSV 파일을 닫고 경로 반환 (기록된 데이터가 없으면 None)"""
+    global _csv_file, _csv_writer, _csv_filepath, _csv_row_count
 
-        # 데이터 초기화
-        _csv_data_collection = []
+    # writer 분리 (다음 자동 실행 시 새 파일 생성)
+    csv_file, filepath, row_count = _csv_file, _csv_filepath, _csv_row_count
+    _csv_file = None
+    _csv_writer = None
+    _csv_filepath = None
+    _csv_row_count = 0
 
+    if csv_file is None:
+        logger.info("📋 CSV 저장: 데이터 없음")
+        return None
+
+    try:
+        # 남은 버퍼 flush + close는 디스크 I/O이므로 이벤트 루프 밖에서 실행
+        await asyncio.to_thread(csv_file.close)
+        logger.info("✅ CSV 보고서 저장 완료: %s (%s건)", filepath, row_count)
         return filepath
 
     except Exception as e:
-        print(f"❌ CSV 저장 실패: {e}")
+        logger.error("❌ CSV 저장 실패: %s", e)
         return None
 
+# 로그 채널 캐시 (channel_id -> 채널 객체) - 채널 삭제 이벤트 시 무효화
+_channel_cache = {}
+
+def _get_log_channel(bot, channel_id: int):
+    """캐시된 채널 객체 반환 (없으면 봇에서 조회 후 캐시)"""
+    channel = _channel_cache.get(channel_id) or bot.get_channel(channel_id)
+    if channel:
+        _channel_cache[channel_id] = channel
+    return channel
+
+async def _on_guild_channel_delete(channel):
+    """채널 삭제 시 로그 채널 캐시에서 제거"""
+    _channel_cache.pop(channel.id, None)
+
+# 사용자 → 소속 길드 캐시 (user_id -> guild_id) - 멤버 입장/퇴장 이벤트 시 무효화
+_member_guild_cache = {}
+
+def _find_member(bot, user_id: int):
+    """사용자가 속한 (member, guild) 반환 - 캐시된 길드를 먼저 확인하고 없으면 전체 길드 탐색"""
+    guild_id = _member_guild_cache.get(user_id)
+    if guild_id is not None:
+        guild = bot.get_guild(guild_id)
+        member = guild.get_member(user_id) if guild else None
+        if member:
+            return member, guild
+        del _member_guild_cache[user_id]
+
+    for guild in bot.guilds:
+        member = guild.get_member(user_id)
+        if member:
+            _member_guild_cache[user_id] = guild.id
+            return member, guild
+    return None, None
+
+async def _on_member_membership_change(member):
+    """멤버 입장/퇴장 시 길드 캐시에서 제거"""
+    _member_guild_cache.pop(member.id, None)
+
 async def send_log_message(bot, channel_id: int, embed: discord.Embed):
     """로그 메시지를 지정된 채널에 전송"""
     try:
         if channel_id == 0:
-            print("⚠️ 채널 ID가 설정되지 않았습니다.")
+            logger.warning("⚠️ 채널 ID가 설정되지 않았습니다.")
             return
             
-        channel = bot.get_channel(channel_id)
+        channel = _get_log_channel(bot, channel_id)
         if not channel:
-            print(f"⚠️ 채널을 찾을 수 없습니다: {channel_id}")
+            logger.warning("⚠️ 채널을 찾을 수 없습니다: %s", channel_id)
             return
             
-        await channel.send(embed=embed)
-        print(f"📨 로그 메시지 전송됨: {channel.name}")
+        await _log_message_bucket.queue(lambda: channel.send(embed=embed))
+        logger.info("📨 로그 메시지 전송됨: %s", channel.name)
         
     except Exception as e:
-        print(f"❌ 로그 메시지 전송 실패: {e}")
+        logger.error("❌ 로그 메시지 전송 실패: %s", e)
+
+# 백그라운드 로그 전송 태스크 (완료 전 GC 방지용 참조 보관)
+_log_tasks = set()
+
+def _log_done(task):
+    _log_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error("❌ 백그라운드 로그 전송 오류: %s", task.exception())
+
+def _log_bg(coro):
+    """로그 전송을 기다리지 않고 백그라운드로 실행 (사용자 처리 경로에서 REST 왕복 제외)"""
+    task = asyncio.get_running_loop().create_task(coro)
+    _log_tasks.add(task)
+    task.add_done_callback(_log_done)
+    return task
 
 async def send_rate_limit_notification(bot):
     """429 오류 발생 시 알림 메시지 전송"""
     try:
         embed = discord.Embed(
             title="⏰ API 속도 제한 감지",
-            description="API 속도 제한으로 인해 5분간 처리를 일시 중단합니다.",
+            description=f"API 속도 제한으로 인해 {format_duration(max(1, round(rate_limit_delay)))}간 처리를 일시 중단합니다.",
             color=0xffaa00
         )
 
         # Unix 타임스탬프 계산
-        rate_limit_unix = int(rate_limit_until.timestamp())
+        rate_limit_unix = int(rate_limit_until_dt.timestamp())
 
         embed.add_field(
             name="📊 현재 상황",
@@ -819,16 +1186,19 @@ async def send_rate_limit_notification(bot):
 
         embed.timestamp = datetime.now()
 
-        await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
-        await send_log_message(bot, SUCCESS_CHANNEL_ID, embed)
+        await asyncio.gather(
+            send_log_message(bot, FAILURE_CHANNEL_ID, embed),
+            send_log_message(bot, SUCCESS_CHANNEL_ID, embed)
+        )
 
     except Exception as e:
-        print(f"❌ 속도 제한 알림 전송 실패: {e}")
+        logger.error("❌ 속도 제한 알림 전송 실패: %s", e)
 
+@profile_task
 async def manual_execute_auto_roles(bot):
     """자동 역할 부여를 수동으로 실행 - 새로운 자동역할 관리자 사용"""
     try:
-        print("🎯 수동 자동 역할 실행 시작")
+        logger.info("🎯 수동 자동 역할 실행 시작")
         
         # 자동역할 관리자에서 역할 목록 가져오기
         role_ids = auto_role_manager.get_roles()
@@ -839,55 +1209,56 @@ async def manual_execute_auto_roles(bot):
                 "message": "자동처리로 설정된 역할이 없습니다. `/자동역할 기능:추가`로 역할을 추가해주세요."
             }
         
+        # 수동 실행은 최신 정보로 처리 (게임 정보 캐시 초기화)
+        _resident_cache.clear()
+
         added_count = 0
         processed_roles = []
-        invalid_roles = []
+        invalid_roles = set()  # 중복 제거용
+        exception_ids = exception_manager.get_all_exception_ids()
         
         # 각 길드에서 역할 멤버들을 대기열에 추가
         for guild in bot.guilds:
-            print(f"🏰 길드 처리: {guild.name}")
+            logger.info("🏰 길드 처리: %s", guild.name)
             
             for role_id in role_ids:
                 try:
                     role = guild.get_role(role_id)
                     
                     if not role:
-                        print(f"⚠️ 역할을 찾을 수 없음: {role_id}")
-                        if role_id not in invalid_roles:
-                            invalid_roles.append(role_id)
+                        logger.warning("⚠️ 역할을 찾을 수 없음: %s", role_id)
+                        invalid_roles.add(role_id)
                         continue
                     
-                    print(f"👥 역할 '{role.name}' 멤버 {len(role.members)}명 처리 중")
+                    members = role.members
+                    member_count = len(members)
                     
-                    role_added_count = 0
-                    for member in role.members:
-                        # 예외 목록 확인
-                        if exception_manager.is_exception(member.id):
-                            print(f"  ⏭️ 예외 대상 건너뜀: {member.display_name}")
-                            continue
-                        
-                        # 대기열에 추가
-                        if queue_manager.add_user(member.id):
-                            added_count += 1
-                            role_added_count += 1
-                            print(f"  ➕ 대기열 추가: {member.display_name}")
-                        else:
-                            print(f"  ⏭️ 이미 대기열에 있음: {member.display_name}")
+                    # 예외 대상을 제외하고 한 번에 대기열에 추가
+                    candidate_ids = [m.id for m in members if m.id not in exception_ids]
+                    role_added_count = len(queue_manager.add_users(candidate_ids))
+                    added_count += role_added_count
+                    
+                    # 역할마다 집계 결과만 한 줄로 출력
+                    skipped_exception = member_count - len(candidate_ids)
+                    skipped_duplicate = len(candidate_ids) - role_added_count
+                    logger.info("👥 역할 '%s' %s명 - 추가 %s명, 중복 %s명, 예외 %s명", role.name, member_count, role_added_count, skipped_duplicate, skipped_exception)
                     
                     # 처리된 역할 정보 저장
                     processed_roles.append({
                         'role': role,
-                        'total_members': len(role.members),
+                        'total_members': member_count,
                         'added_members': role_added_count
                     })
                     
                 except Exception as e:
-                    print(f"⚠️ 역할 처리 오류 ({role_id}): {e}")
-                    if role_id not in invalid_roles:
-                        invalid_roles.append(role_id)
+                    logger.warning("⚠️ 역할 처리 오류 (%s): %s", role_id, e)
+                    invalid_roles.add(role_id)
                     continue
         
-        print(f"✅ 자동 역할 실행 완료 - {added_count}명 대기열 추가")
+        logger.info("✅ 자동 역할 실행 완료 - %s명 대기열 추가", added_count)
+        
+        n_processed = len(processed_roles)
+        n_invalid = len(invalid_roles)
         
         # 자동 역할 실행 완료 로그 전송
         embed = discord.Embed(
@@ -904,8 +1275,8 @@ async def manual_execute_auto_roles(bot):
                     f"• {info['role'].mention}: {info['added_members']}/{info['total_members']}명 추가"
                 )
             
-            if len(processed_roles) > 5:
-                role_info_lines.append(f"• ...그리고 {len(processed_roles) - 5}개 역할 더")
+            if n_processed > 5:
+                role_info_lines.append(f"• ...그리고 {n_processed - 5}개 역할 더")
             
             embed.add_field(
                 name="📋 처리된 역할",
@@ -917,7 +1288,7 @@ async def manual_execute_auto_roles(bot):
         if invalid_roles:
             embed.add_field(
                 name="⚠️ 무효한 역할",
-                value=f"{len(invalid_roles)}개의 역할을 찾을 수 없습니다.\n"
+                value=f"{n_invalid}개의 역할을 찾을 수 없습니다.\n"
                       f"`/자동역할 기능:정리`로 무효한 역할들을 제거할 수 있습니다.",
                 inline=False
             )
@@ -940,19 +1311,21 @@ async def manual_execute_auto_roles(bot):
         
         embed.timestamp = datetime.now()
         
-        await send_log_message(bot, SUCCESS_CHANNEL_ID, embed)
-        await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+        await asyncio.gather(
+            send_log_message(bot, SUCCESS_CHANNEL_ID, embed),
+            send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+        )
         
         return {
             "success": True,
             "message": f"{added_count}명이 대기열에 추가되었습니다.",
             "added_count": added_count,
-            "processed_roles": len(processed_roles),
-            "invalid_roles": len(invalid_roles)
+            "processed_roles": n_processed,
+            "invalid_roles": n_invalid
         }
         
     except Exception as e:
-        print(f"❌ 자동 역할 실행 오류: {e}")
+        logger.error("❌ 자동 역할 실행 오류: %s", e)
         
         # 자동 역할 실행 실패 로그 전송
         embed = discord.Embed(
@@ -978,18 +1351,19 @@ async def manual_execute_auto_roles(bot):
 
 # Discord.py tasks를 사용한 백그라운드 루프
 @tasks.loop(minutes=1)
+@profile_task
 async def queue_processor_loop():
     """대기열 처리 루프 - 1분마다 실행 (완전히 비동기, 블로킹 없음)"""
     global _bot_instance
 
     if _bot_instance is None:
-        print("⚠️ 봇 인스턴스가 없어 대기열 처리를 건너뜁니다")
+        logger.warning("⚠️ 봇 인스턴스가 없어 대기열 처리를 건너뜁니다")
         return
 
     try:
         await process_queue_batch(_bot_instance)
     except Exception as e:
-        print(f"❌ 대기열 처리 루프 오류: {e}")
+        logger.error("❌ 대기열 처리 루프 오류: %s", e)
         import traceback
         traceback.print_exc()
 
@@ -998,74 +1372,115 @@ async def before_queue_processor():
     """대기열 처리 시작 전 봇 준비 대기"""
     if _bot_instance:
         await _bot_instance.wait_until_ready()
-        print("✅ 대기열 처리 루프 준비 완료")
+        logger.info("✅ 대기열 처리 루프 준비 완료")
 
-@tasks.loop(hours=1)
-async def auto_roles_checker():
-    """자동 역할 실행 체크 루프 - 매 시간마다 실행 시간 확인"""
-    global _bot_instance
-
-    if _bot_instance is None:
-        return
+def _compute_next_run(day: int, hour: int, minute: int, now: datetime = None) -> datetime:
+    """다음 자동 실행 시각 계산 (한국 시간 매주 day요일 hour:minute, now 이후 가장 가까운 시각)"""
+    if now is None:
+        now = datetime.now(KST)
 
-    try:
-        from config import config
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    next_run += timedelta(days=(day - now.weekday()) % 7)
+    if next_run <= now:
+        next_run += timedelta(days=7)
+    return next_run
 
-        # 현재 시간 (한국 시간)
-        now = datetime.now()
+async def _auto_roles_scheduler():
+    """자동 역할 실행 스케줄러 - 다음 실행 시각까지 잠들었다가 실행 후 다시 계산"""
+    global _auto_roles_next_run
 
-        # 설정된 실행 시간인지 확인
-        if (now.weekday() == AUTO_EXECUTION_DAY and
-            now.hour == AUTO_EXECUTION_HOUR and
-            0 <= now.minute < 60):  # 해당 시간의 아무 분이나 (중복 실행 방지는 별도 처리)
+    if _bot_instance:
+        await _bot_instance.wait_until_ready()
+    logger.info("✅ 자동 역할 스케줄러 준비 완료")
 
-            print(f"🎯 자동 역할 실행 시간 도달: {now.strftime('%Y-%m-%d %H:%M')}")
+    last_run = None
+    while True:
+        _auto_roles_next_run = _compute_next_run(
+            AUTO_EXECUTION_DAY, AUTO_EXECUTION_HOUR, AUTO_EXECUTION_MINUTE,
+            now=max(datetime.now(KST), last_run) if last_run else None
+        )
+        logger.info("⏰ 다음 자동 역할 실행 예정: %s (KST)", _auto_roles_next_run.strftime('%Y-%m-%d %H:%M'))
 
-            # 백그라운드로 실행 (블로킹 방지)
-            asyncio.create_task(execute_auto_roles(_bot_instance))
+        # 최대 하루 단위로 나눠 대기 (시스템 시계 변경/절전 복귀 시 오차 보정)
+        while True:
+            remaining = (_auto_roles_next_run - datetime.now(KST)).total_seconds()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, 86400))
 
-    except Exception as e:
-        print(f"❌ 자동 역할 체크 루프 오류: {e}")
+        last_run = _auto_roles_next_run
+        if _bot_instance is None:
+            continue
 
-@auto_roles_checker.before_loop
-async def before_auto_roles_checker():
-    """자동 역할 체크 시작 전 봇 준비 대기"""
-    if _bot_instance:
-        await _bot_instance.wait_until_ready()
-        print("✅ 자동 역할 체크 루프 준비 완료")
+        logger.info("🎯 자동 역할 실행 시간 도달: %s (KST)", datetime.now(KST).strftime('%Y-%m-%d %H:%M'))
+        try:
+            await execute_auto_roles(_bot_instance)
+        except Exception as e:
+            logger.error("❌ 자동 역할 스케줄러 오류: %s", e)
 
 def start_scheduler(bot):
     """스케줄러 시작 - discord.ext.tasks 사용"""
-    global _bot_instance
+    global _bot_instance, _drain_task, _auto_roles_task
 
     try:
-        print("🚀 백그라운드 태스크 시작")
+        logger.info("🚀 백그라운드 태스크 시작")
+
+        # 사용자 처리 상세 로그 출력 스레드 시작
+        start_log_listener()
 
         # 봇 인스턴스 저장
         _bot_instance = bot
 
+        # 로그 채널 캐시 무효화 이벤트 등록 (on_ready 재호출 시 중복 등록 방지)
+        bot.remove_listener(_on_guild_channel_delete, 'on_guild_channel_delete')
+        bot.add_listener(_on_guild_channel_delete, 'on_guild_channel_delete')
+
+        # 멤버 길드 캐시 무효화 이벤트 등록
+        for event_name in ('on_member_join', 'on_member_remove'):
+            bot.remove_listener(_on_member_membership_change, event_name)
+            bot.add_listener(_on_member_membership_change, event_name)
+
+        # 대기열 처리 완료 감시 태스크 시작 (on_ready 재호출 시 중복 실행 방지)
+        if _drain_task is None or _drain_task.done():
+            _drain_task = asyncio.get_running_loop().create_task(_drain_watcher(bot))
+
         # 대기열 처리 루프 시작
         if not queue_processor_loop.is_running():
             queue_processor_loop.start()
-            print("   ✅ 대기열 처리 루프 시작 (1분마다)")
-
-        # 자동 역할 체크 루프 시작
-        if not auto_roles_checker.is_running():
-            auto_roles_checker.start()
+            logger.info("   ✅ 대기열 처리 루프 시작 (1분마다)")
 
-            day_names = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
-            day_name = day_names[AUTO_EXECUTION_DAY] if 0 <= AUTO_EXECUTION_DAY <= 6 else "알 수 없음"
+        # 자동 역할 스케줄러 시작 (다음 실행 시각까지 대기)
+        if _auto_roles_task is None or _auto_roles_task.done():
+            _auto_roles_task = asyncio.get_running_loop().create_task(_auto_roles_scheduler())
 
-            print(f"   ✅ 자동 역할 체크 루프 시작")
-            print(f"   🎯 자동 역할 실행 예정: 매주 {day_name} {AUTO_EXECUTION_HOUR:02d}:{AUTO_EXECUTION_MINUTE:02d}")
+            logger.info("   ✅ 자동 역할 스케줄러 시작")
+            logger.info("   🎯 자동 역할 실행 예정: %s", _AUTO_RUN_NEXT)
 
-        print("✅ 백그라운드 태스크 시작 완료 (명령어와 완전히 분리됨)")
+        logger.info("✅ 백그라운드 태스크 시작 완료 (명령어와 완전히 분리됨)")
 
     except Exception as e:
-        print(f"❌ 백그라운드 태스크 시작 실패: {e}")
+        logger.error("❌ 백그라운드 태스크 시작 실패: %s", e)
         import traceback
         traceback.print_exc()
 
+def _get_http_session() -> aiohttp.ClientSession:
+    """공유 HTTP 세션 반환 (없거나 닫혔으면 이벤트 루프 안에서 새로 생성)"""
+    global _http_session
+
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75)
+        _http_session = aiohttp.ClientSession(connector=connector)
+    return _http_session
+
+async def close_http_session():
+    """공유 HTTP 세션 종료 (봇 종료 시 호출)"""
+    global _http_session
+
+    session, _http_session = _http_session, None
+    if session is not None and not session.closed:
+        await session.close()
+        logger.info("   ✅ HTTP 세션 종료")
+
 def clear_queue():
     """대기열 초기화"""
     try:
@@ -1073,43 +1488,224 @@ def clear_queue():
 
         queue_size = len(db_manager.get_queue())
         if queue_size > 0:
-            print(f"🗑️ 대기열 초기화 중... ({queue_size}명)")
+            logger.info("🗑️ 대기열 초기화 중... (%s명)", queue_size)
             db_manager.conn.execute("DELETE FROM queue")
             db_manager.conn.commit()
-            print(f"   ✅ {queue_size}명의 대기열 항목 삭제 완료")
+            logger.info("   ✅ %s명의 대기열 항목 삭제 완료", queue_size)
         else:
-            print("   ℹ️ 대기열이 비어있음")
+            logger.info("   ℹ️ 대기열이 비어있음")
     except Exception as e:
-        print(f"   ❌ 대기열 초기화 실패: {e}")
+        logger.error("   ❌ 대기열 초기화 실패: %s", e)
 
 def stop_scheduler():
     """스케줄러 중지 및 대기열 초기화"""
+    global _drain_task, _auto_roles_task
+
     try:
-        print("🛑 백그라운드 태스크 중지")
+        logger.info("🛑 백그라운드 태스크 중지")
 
         if queue_processor_loop.is_running():
             queue_processor_loop.cancel()
-            print("   ✅ 대기열 처리 루프 중지")
+            logger.info("   ✅ 대기열 처리 루프 중지")
+
+        if _auto_roles_task is not None:
+            _auto_roles_task.cancel()
+            _auto_roles_task = None
+            logger.info("   ✅ 자동 역할 스케줄러 중지")
+
+        if _drain_task is not None:
+            _drain_task.cancel()
+            _drain_task = None
 
-        if auto_roles_checker.is_running():
-            auto_roles_checker.cancel()
-            print("   ✅ 자동 역할 체크 루프 중지")
+        # 공유 HTTP 세션 종료 (실행 중인 이벤트 루프가 있을 때만 예약)
+        try:
+            asyncio.get_running_loop().create_task(close_http_session())
+        except RuntimeError:
+            pass
 
-        print("✅ 백그라운드 태스크 중지 완료")
+        logger.info("✅ 백그라운드 태스크 중지 완료")
 
         # 대기열 초기화
         clear_queue()
 
+        # 남은 상세 로그 출력 후 로그 스레드 종료
+        stop_log_listener()
+
     except Exception as e:
-        print(f"❌ 백그라운드 태스크 중지 실패: {e}")
+        logger.error("❌ 백그라운드 태스크 중지 실패: %s", e)
+
+async def _process_queued_user(bot, session, user_id, town_role_index=None, resolved=None):
+    """배치 내 사용자 1명 처리 - 속도 제한 중이면 처리하지 않고 대기열에 재추가"""
+    if is_rate_limited():
+        logger.info("⏸️ 속도 제한 중 - 사용자 대기열에 재추가: %s", user_id)
+        queue_manager.add_user(user_id)
+        return None
+
+    # Discord 요청 동시 실행 수는 _discord_concurrency가 429/5xx 빈도에 맞춰 조절
+    async with _discord_concurrency:
+        result = await process_single_user(bot, session, user_id, town_role_index=town_role_index, resolved=resolved)
+
+    if result and result.get('success'):
+        await _discord_concurrency.on_success()
+    return result
+
+async def _single_discord_lookup(bot, session, user_id):
+    """디스코드 ID → (UUID, 마크 닉네임, 오류 메시지) 조회 - 속도 제한/네트워크 오류 시 None (개별 처리에서 다시 조회)"""
+    await _api_limiter.acquire()
+    if is_rate_limited():
+        return None
+
+    url = f"{MC_API_BASE}/discord?discord={user_id}"
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as r:
+            if r.status == 429:
+                logger.warning("🚨 API 속도 제한 감지 (배치 선조회) - 사용자 %s", user_id)
+                await _report_rate_limit(bot, r, user_id)
+                return None
+            _note_api_success()
+            if r.status != 200:
+                return (None, None, f"마인크래프트 계정 연동 정보를 찾을 수 없습니다 (HTTP {r.status})")
+            data = await r.json()
+    except Exception as e:
+        logger.warning("  ⚠️ 배치 선조회 실패 (%s): %s", user_id, e)
+        return None
+
+    entries = data.get('data')
+    if not entries:
+        return (None, None, "마인크래프트 계정이 연동되지 않았습니다")
+
+    uuid = entries[0].get('uuid')
+    mc_id = entries[0].get('name')
+    if not uuid or not mc_id:
+        return (None, None, "마인크래프트 계정 정보가 불완전합니다")
+    return (uuid, mc_id, None)
+
+async def _resolve_uuids(bot, session, user_ids):
+    """묶음 사용자들의 디스코드 ID → UUID를 한 번에 조회 (DB 일괄 조회 후 나머지만 API 동시 조회)
+
+    Returns:
+        {user_id: (uuid, mc_id, error_message)} - 조회하지 못한 사용자는 제외 (개별 처리에서 조회)
+    """
+    # 예외 사용자/서버에 없는 사용자는 개별 처리에서 API 없이 종료되므로 조회하지 않음
+    exception_ids = exception_manager.get_all_exception_ids()
+    targets = [
+        uid for uid in user_ids
+        if uid not in exception_ids and _find_member(bot, uid)[0]
+    ]
+
+    resolved = {}
+    if DATABASE_ENABLED and db_manager and targets:
+        try:
+            users_info = await asyncio.to_thread(db_manager.get_users_info, targets)
+            for uid, user_data in users_info.items():
+                cached_uuid = user_data.get('minecraft_uuid')
+                cached_mc_name = user_data.get('current_minecraft_name')
+                if cached_uuid and cached_mc_name:
+                    resolved[uid] = (cached_uuid, cached_mc_name, None)
+        except Exception as db_error:
+            logger.warning("  ⚠️ 데이터베이스 일괄 조회 실패: %s", db_error)
+
+    db_hits = len(resolved)
+    remaining = [uid for uid in targets if uid not in resolved]
+    if remaining and not is_rate_limited():
+        results = await asyncio.gather(
+            *(_single_discord_lookup(bot, session, uid) for uid in remaining),
+            return_exceptions=True
+        )
+        for uid, result in zip(remaining, results):
+            if isinstance(result, tuple):
+                resolved[uid] = result
+
+    logger.info("🔎 UUID 선조회: DB %s명, API %s/%s명", db_hits, len(resolved) - db_hits, len(remaining))
+    return resolved
+
+async def _on_queue_drained(bot):
+    """대기열 처리 완료 시 CSV 보고서 저장 및 완료 메시지 전송"""
+    global _is_auto_execution
+
+    logger.info("🎉 모든 대기열 처리 완료!")
+
+    # CSV 보고서 저장 (자동 실행 시에만 데이터가 수집되었을 것임)
+    csv_filepath = await save_csv_report()
+
+    # 자동 실행 플래그 해제 (모든 처리 완료)
+    if _is_auto_execution:
+        _is_auto_execution = False
+        logger.info("📋 CSV 데이터 수집 비활성화됨 (대기열 처리 완료)")
+
+    # 완료 메시지 임베드 생성
+    embed = discord.Embed(
+        title="✅ 자동 실행 완료",
+        description="모든 대기열 처리가 완료되었습니다.",
+        color=0x00ff00
+    )
+
+    embed.add_field(
+        name="📊 처리 결과",
+        value="대기열에 있던 모든 사용자의 처리가 완료되었습니다.",
+        inline=False
+    )
+
+    # CSV 파일명/내용은 한 번만 계산해 두 채널 전송에 재사용 (디스크 읽기는 이벤트 루프 밖에서)
+    csv_filename = os.path.basename(csv_filepath) if csv_filepath else None
+    csv_bytes = None
+    if csv_filepath:
+        try:
+            csv_bytes = await asyncio.to_thread(Path(csv_filepath).read_bytes)
+        except OSError as e:
+            logger.warning("⚠️ CSV 보고서 읽기 실패: %s", e)
+
+    if csv_filepath:
+        embed.add_field(
+            name="📄 CSV 보고서",
+            value=f"파일명: `{csv_filename}`\n자동 실행 결과가 CSV 파일로 저장되었습니다.",
+            inline=False
+        )
+
+    embed.timestamp = datetime.now()
+
+    # 성공 채널과 실패 채널 모두에 전송 (CSV 파일 첨부)
+    try:
+        if SUCCESS_CHANNEL_ID and SUCCESS_CHANNEL_ID != 0:
+            success_channel = _get_log_channel(bot, SUCCESS_CHANNEL_ID)
+            if success_channel:
+                if csv_bytes is not None:
+                    discord_file = discord.File(io.BytesIO(csv_bytes), filename=csv_filename)
+                    await _log_message_bucket.queue(lambda: success_channel.send(embed=embed, file=discord_file))
+                else:
+                    await _log_message_bucket.queue(lambda: success_channel.send(embed=embed))
+    except Exception as e:
+        logger.warning("⚠️ 성공 채널 전송 실패: %s", e)
+
+    try:
+        if FAILURE_CHANNEL_ID and FAILURE_CHANNEL_ID != 0:
+            failure_channel = _get_log_channel(bot, FAILURE_CHANNEL_ID)
+            if failure_channel:
+                if csv_bytes is not None:
+                    discord_file = discord.File(io.BytesIO(csv_bytes), filename=csv_filename)
+                    await _log_message_bucket.queue(lambda: failure_channel.send(embed=embed, file=discord_file))
+                else:
+                    await _log_message_bucket.queue(lambda: failure_channel.send(embed=embed))
+    except Exception as e:
+        logger.warning("⚠️ 실패 채널 전송 실패: %s", e)
+
+async def _drain_watcher(bot):
+    """대기열 drained 이벤트를 기다렸다가 완료 처리 실행 (스케줄러 시작 시 1개만 실행)"""
+    while True:
+        await queue_manager.drained.wait()
+        queue_manager.drained.clear()
+        try:
+            await _on_queue_drained(bot)
+        except Exception as e:
+            logger.error("❌ 대기열 완료 처리 오류: %s", e)
 
 async def process_queue_batch(bot):
     """대기열에서 사용자들을 배치로 처리 - 429 오류 처리 추가"""
     try:
         # 속도 제한 상태 확인
         if is_rate_limited():
-            remaining_time = (rate_limit_until - datetime.now()).total_seconds()
-            print(f"⏸️ API 속도 제한 중 - 남은 시간: {remaining_time:.0f}초")
+            remaining_time = rate_limit_until - time.monotonic()
+            logger.info("⏸️ API 속도 제한 중 - 남은 시간: %.0f초", remaining_time)
             return
 
         # 처리 전 대기열 크기 확인
@@ -1118,116 +1714,138 @@ async def process_queue_batch(bot):
         if queue_size_before == 0:
             return
 
-        print("🔄 대기열 배치 처리 시작")
+        logger.info("🔄 대기열 배치 처리 시작")
         queue_manager.processing = True
 
-        # 배치 크기 (한 번에 처리할 사용자 수)
-        batch_size = 5
+        # 배치 크기 (한 번에 처리할 사용자 수) - 1분 주기 안에 끝나도록 API 한도에 맞춤
+        batch_size = API_BATCH_SIZE
         processed_users = []
 
-        for _ in range(batch_size):
+        # 백오프 중인 사용자는 건너뛰고 대기열 뒤로 보냄 (대기열을 한 바퀴 이상 돌지 않음)
+        now = time.monotonic()
+        deferred_users = []
+        scan_limit = queue_size_before
+        while len(processed_users) < batch_size and scan_limit > 0:
             user_id = queue_manager.get_next()
             if user_id is None:
                 break
+            scan_limit -= 1
+            if _next_eligible_at.get(user_id, 0.0) > now:
+                deferred_users.append(user_id)
+                continue
+            _next_eligible_at.pop(user_id, None)
             processed_users.append(user_id)
 
+        if deferred_users:
+            queue_manager.add_users(deferred_users)
+            logger.info("⏳ 재시도 대기 중인 사용자 %s명 건너뜀", len(deferred_users))
+
         if not processed_users:
-            queue_manager.processing = False
             return
 
-        print(f"📋 배치 처리 대상: {len(processed_users)}명")
-
-        # API 세션 생성
-        async with aiohttp.ClientSession() as session:
-            for user_id in processed_users:
-                try:
-                    # 속도 제한 재확인 (배치 중간에 발생할 수 있음)
-                    if is_rate_limited():
-                        print(f"⏸️ 배치 처리 중 속도 제한 감지 - 나머지 사용자 대기열에 재추가")
-                        # 처리되지 않은 사용자들을 대기열에 다시 추가
-                        queue_manager.add_user(user_id)
-                        break
-
-                    await process_single_user(bot, session, user_id)
-                    await asyncio.sleep(10)  # API 제한을 위한 대기 (비블로킹)
-                except Exception as e:
-                    print(f"❌ 사용자 {user_id} 처리 실패: {e}")
-
-        print(f"✅ 배치 처리 완료: {len(processed_users)}명")
-
-        # 처리 후 대기열이 비었는지 확인하고 완료 메시지 전송
-        queue_size_after = queue_manager.get_queue_size()
+        logger.info("📋 배치 처리 대상: %s명", len(processed_users))
+
+        # 마을 역할 매핑은 배치당 한 번만 변환
+        town_role_index = _build_town_role_index()
+
+        # 공유 API 세션으로 배치 사용자를 작은 묶음씩 동시에 처리 (요청 간격은 _api_limiter가 조절)
+        # 묶음 크기는 _discord_concurrency의 현재 허용 동시 실행 수 - 성공이 이어지면 커지고 429/5xx가 나면 줄어듦
+        # UUID 선조회도 묶음마다 처리 직전에 해서 첫 역할 갱신이 늦어지거나 429 후 조회 결과가 버려지지 않게 함
+        session = _get_http_session()
+        handled = 0
+        start = 0
+        while start < len(processed_users):
+            if is_rate_limited():
+                remaining_users = processed_users[start:]
+                queue_manager.add_users(remaining_users)
+                logger.info("⏸️ 배치 처리 중 속도 제한 감지 - 나머지 %s명 대기열에 재추가", len(remaining_users))
+                break
 
-        # 대기열이 비어있고, 처리 전에는 비어있지 않았다면 완료 메시지 전송
-        if queue_size_after == 0 and queue_size_before > 0:
-            print("🎉 모든 대기열 처리 완료!")
+            chunk = processed_users[start:start + _discord_concurrency.limit]
+            start += len(chunk)
+            resolved = await _resolve_uuids(bot, session, chunk)
+            results = await asyncio.gather(
+                *(_process_queued_user(bot, session, user_id, town_role_index, resolved.get(user_id))
+                  for user_id in chunk),
+                return_exceptions=True
+            )
+            handled += len(chunk)
 
-            # CSV 보고서 저장 (자동 실행 시에만 데이터가 수집되었을 것임)
-            csv_filepath = save_csv_report()
+            for user_id, result in zip(chunk, results):
+                if isinstance(result, BaseException):
+                    logger.error("❌ 사용자 %s 처리 실패: %s", user_id, result)
 
-            # 자동 실행 플래그 해제 (모든 처리 완료)
-            global _is_auto_execution
-            if _is_auto_execution:
-                _is_auto_execution = False
-                print("📋 CSV 데이터 수집 비활성화됨 (대기열 처리 완료)")
+        logger.info("✅ 배치 처리 완료: %s명", handled)
 
-            # 완료 메시지 임베드 생성
-            embed = discord.Embed(
-                title="✅ 자동 실행 완료",
-                description="모든 대기열 처리가 완료되었습니다.",
-                color=0x00ff00
-            )
+    except Exception as e:
+        logger.error("❌ 배치 처리 오류: %s", e)
+    finally:
+        # 대기열이 비었으면 drained 이벤트 → _drain_watcher가 완료 알림 전송
+        queue_manager.end_batch()
+
+def _build_failure_embed(member, user_id, mc_id, town, nation, nation_ranks,
+                         last_online_formatted, days_offline, error,
+                         role_removal_changes=None, guild=None) -> discord.Embed:
+    """사용자 처리 실패 로그 임베드 생성"""
+    embed = discord.Embed(
+        title="❌ 사용자 처리 실패",
+        color=0xff0000
+    )
+
+    if member:
+        user_info = f"**Discord:** {member.mention}\n**닉네임:** {member.display_name}"
+    else:
+        user_info = f"**사용자 ID:** {user_id}"
+    embed.add_field(name="👤 사용자 정보", value=user_info, inline=False)
+
+    if mc_id:
+        parts = [f"**마인크래프트 닉네임:** ``{mc_id}``"]
+        if town:
+            parts.append(f"**마을:** {town}")
+            # 마을 역할 연동 상태도 표시
+            if TOWN_ROLE_ENABLED and town_role_manager:
+                role_id = town_role_manager.get_role_id_by_name(town)
+                if role_id:
+                    town_role = guild.get_role(role_id) if guild else None
+                    if town_role:
+                        parts.append(f"**마을 역할:** {town_role.mention}")
+                    else:
+                        parts.append(f"**마을 역할:** ⚠️ 역할 없음 (ID: {role_id})")
+                else:
+                    parts.append("**마을 역할:** ℹ️ 연동 안됨")
+        if nation:
+            parts.append(f"**국가:** {nation}")
+            if nation_ranks:
+                parts.append(f"**국가 계급:** {nation_ranks}")
+        if last_online_formatted:
+            parts.append(f"**마지막 온라인:** {last_online_formatted} ({days_offline})")
 
-            embed.add_field(
-                name="📊 처리 결과",
-                value="대기열에 있던 모든 사용자의 처리가 완료되었습니다.",
-                inline=False
-            )
+        embed.add_field(name="🎮 마인크래프트 정보", value="\n".join(parts), inline=False)
 
-            if csv_filepath:
-                csv_filename = os.path.basename(csv_filepath)
-                embed.add_field(
-                    name="📄 CSV 보고서",
-                    value=f"파일명: `{csv_filename}`\n자동 실행 결과가 CSV 파일로 저장되었습니다.",
-                    inline=False
-                )
+    embed.add_field(
+        name="❌ 오류 내용",
+        value=str(error)[:1000],  # 너무 긴 오류 메시지 제한
+        inline=False
+    )
 
-            embed.timestamp = datetime.now()
-
-            # 성공 채널과 실패 채널 모두에 전송 (CSV 파일 첨부)
-            try:
-                if SUCCESS_CHANNEL_ID and SUCCESS_CHANNEL_ID != 0:
-                    success_channel = bot.get_channel(SUCCESS_CHANNEL_ID)
-                    if success_channel:
-                        if csv_filepath and os.path.exists(csv_filepath):
-                            with open(csv_filepath, 'rb') as f:
-                                discord_file = discord.File(f, filename=os.path.basename(csv_filepath))
-                                await success_channel.send(embed=embed, file=discord_file)
-                        else:
-                            await success_channel.send(embed=embed)
-            except Exception as e:
-                print(f"⚠️ 성공 채널 전송 실패: {e}")
+    # 역할 제거 변경사항이 있으면 추가
+    if role_removal_changes:
+        embed.add_field(
+            name="🗑️ 제거된 역할",
+            value="\n".join(role_removal_changes),
+            inline=False
+        )
 
-            try:
-                if FAILURE_CHANNEL_ID and FAILURE_CHANNEL_ID != 0:
-                    failure_channel = bot.get_channel(FAILURE_CHANNEL_ID)
-                    if failure_channel:
-                        if csv_filepath and os.path.exists(csv_filepath):
-                            with open(csv_filepath, 'rb') as f:
-                                discord_file = discord.File(f, filename=os.path.basename(csv_filepath))
-                                await failure_channel.send(embed=embed, file=discord_file)
-                        else:
-                            await failure_channel.send(embed=embed)
-            except Exception as e:
-                print(f"⚠️ 실패 채널 전송 실패: {e}")
+    embed.timestamp = datetime.now()
+    return embed
 
-    except Exception as e:
-        print(f"❌ 배치 처리 오류: {e}")
-    finally:
-        queue_manager.processing = False
+async def process_single_user(bot, session, user_id, town_role_index=None, resolved=None, refresh=False,
+                              priority=False, requeue=True):
+    """단일 사용자 처리 - 429 오류 처리 및 재대기열 추가, 마지막 온라인 정보 포함
 
-async def process_single_user(bot, session, user_id):
-    """단일 사용자 처리 - 429 오류 처리 및 재대기열 추가, 마지막 온라인 정보 포함"""
+    명령어처럼 사용자가 기다리는 호출은 priority=True로 API 슬롯을 먼저 받고,
+    requeue=False면 속도 제한 시 대기열에 넣지 않고 실패 결과를 돌려줍니다.
+    """
     member = None
     guild = None
     mc_id = None
@@ -1241,24 +1859,19 @@ async def process_single_user(bot, session, user_id):
     error_message = None
 
     try:
-        print(f"👤 사용자 처리 시작: {user_id}")
+        logger.info("👤 사용자 처리 시작: %s", user_id)
 
         # 예외 사용자 확인 (최우선 체크)
         if exception_manager and exception_manager.is_exception(user_id):
-            print(f"⏭️ 예외 사용자 건너뜀: {user_id}")
+            logger.info("⏭️ 예외 사용자 건너뜀: %s", user_id)
             return {'success': False, 'error': '예외 사용자'}
 
-        # 모든 길드에서 해당 사용자 찾기
-        for g in bot.guilds:
-            m = g.get_member(user_id)
-            if m:
-                member = m
-                guild = g
-                break
+        # 사용자가 속한 길드 찾기 (캐시 우선)
+        member, guild = _find_member(bot, user_id)
 
         if not member or not guild:
             error_message = "서버에서 사용자를 찾을 수 없습니다."
-            print(f"⚠️ {error_message}: {user_id}")
+            logger.warning("⚠️ %s: %s", error_message, user_id)
 
             # 실패 로그 전송
             embed = discord.Embed(
@@ -1273,46 +1886,59 @@ async def process_single_user(bot, session, user_id):
             )
             embed.timestamp = datetime.now()
 
-            await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+            _log_bg(send_log_message(bot, FAILURE_CHANNEL_ID, embed))
             return {'success': False, 'error': error_message}
 
-        # 데이터베이스에서 UUID 먼저 확인 (API 요청 최적화)
+        # 배치 선조회 결과가 있으면 DB/API 1단계를 건너뜀
         cached_uuid = None
         cached_mc_name = None
-        if DATABASE_ENABLED and db_manager:
+        if resolved is not None:
+            resolved_uuid, resolved_mc_id, resolve_error = resolved
+            if resolve_error:
+                error_message = resolve_error
+                logger.error("  ❌ 1단계 실패 (배치 선조회): %s", error_message)
+                raise Exception(error_message)
+            cached_uuid = uuid = resolved_uuid
+            cached_mc_name = mc_id = resolved_mc_id
+            logger.info("  ⚡ 배치 선조회 결과 사용: %s (UUID: %s...)", mc_id, uuid[:8])
+        # 데이터베이스에서 UUID 먼저 확인 (API 요청 최적화)
+        elif DATABASE_ENABLED and db_manager:
             try:
-                user_data = db_manager.get_user_info(user_id)
+                user_data = await asyncio.to_thread(db_manager.get_user_info, user_id)
                 if user_data:
                     cached_uuid = user_data.get('minecraft_uuid')
                     cached_mc_name = user_data.get('current_minecraft_name')
                     if cached_uuid and cached_mc_name:
-                        print(f"  💾 데이터베이스에서 UUID 조회: {cached_mc_name} (UUID: {cached_uuid[:8]}...)")
+                        logger.info("  💾 데이터베이스에서 UUID 조회: %s (UUID: %s...)", cached_mc_name, cached_uuid[:8])
                         uuid = cached_uuid
                         mc_id = cached_mc_name
             except Exception as db_error:
-                print(f"  ⚠️ 데이터베이스 조회 실패: {db_error}")
+                logger.warning("  ⚠️ 데이터베이스 조회 실패: %s", db_error)
 
         # 데이터베이스에 UUID가 없으면 API로 조회
         if not cached_uuid:
-            print(f"  🔍 API를 통해 UUID 조회 중...")
+            logger.info("  🔍 API를 통해 UUID 조회 중...")
             # 1단계: 디스코드 ID → UUID, MC Name
             url1 = f"{MC_API_BASE}/discord?discord={user_id}"
 
+            if not await _acquire_api_slot(user_id, priority=priority, requeue=requeue):
+                return None if requeue else {'success': False, 'error': RATE_LIMITED_ERROR}
             async with session.get(url1, timeout=aiohttp.ClientTimeout(total=10)) as r1:
                 if r1.status == 429:
                     # 429 오류 처리
-                    print(f"🚨 API 속도 제한 감지 (1단계) - 사용자 {user_id} 재대기열 추가")
-                    handle_rate_limit()
-                    await send_rate_limit_notification(bot)
+                    logger.warning("🚨 API 속도 제한 감지 (1단계) - 사용자 %s", user_id)
+                    await _report_rate_limit(bot, r1, user_id)
+                    if not requeue:
+                        return {'success': False, 'error': RATE_LIMITED_ERROR}
 
                     # 재시도 횟수 확인
                     retry_count = increment_retry_count(user_id)
                     if should_retry(user_id):
-                        queue_manager.add_user(user_id)  # 재대기열에 추가
-                        print(f"  🔄 재시도 {retry_count}/{MAX_RETRY_COUNT}: {member.display_name}")
+                        _schedule_retry(user_id, retry_count)  # 백오프 후 재대기열에 추가
+                        logger.info("  🔄 재시도 %s/%s: %s", retry_count, MAX_RETRY_COUNT, member.display_name)
                     else:
                         clear_retry_count(user_id)
-                        print(f"  ❌ 최대 재시도 횟수 초과: {member.display_name}")
+                        logger.error("  ❌ 최대 재시도 횟수 초과: %s", member.display_name)
 
                         # 최대 재시도 초과 로그
                         embed = discord.Embed(
@@ -1331,17 +1957,18 @@ async def process_single_user(bot, session, user_id):
                             inline=False
                         )
                         embed.timestamp = datetime.now()
-                        await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+                        _log_bg(send_log_message(bot, FAILURE_CHANNEL_ID, embed))
                     return
                 elif r1.status != 200:
                     error_message = f"마인크래프트 계정 연동 정보를 찾을 수 없습니다 (HTTP {r1.status})"
-                    print(f"  ❌ 1단계 실패: {r1.status}")
+                    logger.error("  ❌ 1단계 실패: %s", r1.status)
                     raise Exception(error_message)
 
+                _note_api_success()
                 data1 = await r1.json()
                 if not data1.get('data') or not data1['data']:
                     error_message = "마인크래프트 계정이 연동되지 않았습니다"
-                    print(f"  ❌ 마크 계정 연동 데이터 없음")
+                    logger.error("  ❌ 마크 계정 연동 데이터 없음")
                     raise Exception(error_message)
 
                 uuid = data1['data'][0].get('uuid')
@@ -1349,128 +1976,140 @@ async def process_single_user(bot, session, user_id):
 
                 if not uuid or not mc_id:
                     error_message = "마인크래프트 계정 정보가 불완전합니다"
-                    print(f"  ❌ UUID 또는 이름 없음")
+                    logger.error("  ❌ UUID 또는 이름 없음")
                     raise Exception(error_message)
 
-                print(f"  ✅ 마크 정보: {mc_id} (UUID: {uuid[:8]}...)")
-                await asyncio.sleep(5)  # API 제한을 위한 대기 (비블로킹)
+                logger.info("  ✅ 마크 정보: %s (UUID: %s...)", mc_id, uuid[:8])
         else:
-            # 데이터베이스에서 UUID를 가져온 경우, API 대기 시간 스킵
-            print(f"  ⚡ 캐시된 UUID 사용 - API 대기 시간 스킵")
+            # 데이터베이스에서 UUID를 가져온 경우, 1단계 API 요청 스킵
+            logger.info("  ⚡ 캐시된 UUID 사용 - 1단계 API 요청 스킵")
 
         # 2단계: UUID → 모든 게임 정보 (개선된 API 사용)
         url2 = f"{MC_API_BASE}/resident?uuid={uuid}"
         
-        async with session.get(url2, timeout=aiohttp.ClientTimeout(total=10)) as r2:
-            if r2.status == 429:
-                # 429 오류 처리
-                print(f"🚨 API 속도 제한 감지 (2단계) - 사용자 {user_id} 재대기열 추가")
-                handle_rate_limit()
-                await send_rate_limit_notification(bot)
+        # 최근 조회한 UUID면 캐시된 게임 정보 사용 (TTL 동안 API 요청 생략, refresh 시 항상 새로 조회)
+        game_info = None if refresh else _resident_cache.get(uuid)
+        if game_info is not None:
+            logger.info("  ⚡ 캐시된 게임 정보 사용 (UUID: %s...)", uuid[:8])
+        else:
+            if not await _acquire_api_slot(user_id, priority=priority, requeue=requeue):
+                return None if requeue else {'success': False, 'error': RATE_LIMITED_ERROR}
+            async with session.get(url2, timeout=aiohttp.ClientTimeout(total=10)) as r2:
+                if r2.status == 429:
+                    # 429 오류 처리
+                    logger.warning("🚨 API 속도 제한 감지 (2단계) - 사용자 %s", user_id)
+                    await _report_rate_limit(bot, r2, user_id)
+                    if not requeue:
+                        return {'success': False, 'error': RATE_LIMITED_ERROR}
                 
-                # 재시도 횟수 확인
-                retry_count = increment_retry_count(user_id)
-                if should_retry(user_id):
-                    queue_manager.add_user(user_id)  # 재대기열에 추가
-                    print(f"  🔄 재시도 {retry_count}/{MAX_RETRY_COUNT}: {member.display_name}")
-                else:
-                    clear_retry_count(user_id)
-                    print(f"  ❌ 최대 재시도 횟수 초과: {member.display_name}")
-                return
-            elif r2.status != 200:
-                error_message = f"게임 정보를 조회할 수 없습니다 (HTTP {r2.status})"
-                print(f"  ❌ 2단계 실패: {r2.status}")
-                raise Exception(error_message)
-            
-            data2 = await r2.json()
-            if not data2.get('data') or not data2['data']:
-                error_message = "게임 내 정보가 없습니다"
-                print(f"  ❌ 게임 데이터 없음")
-                raise Exception(error_message)
+                    # 재시도 횟수 확인
+                    retry_count = increment_retry_count(user_id)
+                    if should_retry(user_id):
+                        _schedule_retry(user_id, retry_count)  # 백오프 후 재대기열에 추가
+                        logger.info("  🔄 재시도 %s/%s: %s", retry_count, MAX_RETRY_COUNT, member.display_name)
+                    else:
+                        clear_retry_count(user_id)
+                        logger.error("  ❌ 최대 재시도 횟수 초과: %s", member.display_name)
+                    return
+                elif r2.status != 200:
+                    error_message = f"게임 정보를 조회할 수 없습니다 (HTTP {r2.status})"
+                    logger.error("  ❌ 2단계 실패: %s", r2.status)
+                    raise Exception(error_message)
             
-            game_info = data2['data'][0]
-
-            # 모든 게임 정보 추출
-            nation = game_info.get('nation')
-            nation_uuid = game_info.get('nationUUID')  # UUID 추출 (camelCase)
-            if not nation_uuid:
-                nation_uuid = game_info.get('nationUuid')  # lowercase uuid도 시도
-
-            town = game_info.get('town')
-            town_uuid = game_info.get('townUUID')  # UUID 추출
-            if not town_uuid:
-                town_uuid = game_info.get('townUuid')
-
-            nation_ranks = game_info.get('nationRanks', '')
-            town_ranks = game_info.get('townRanks', '')
-            last_online = game_info.get('lastOnline')
-
-            # 국가 또는 마을 정보가 없는 경우 처리
-            if not nation:
-                nation = "❌"  # 국가 정보 없음
-            if not town:
-                town = "❌"  # 마을 정보 없음
+                _note_api_success()
+                data2 = await r2.json()
+                if not data2.get('data') or not data2['data']:
+                    error_message = "게임 내 정보가 없습니다"
+                    logger.error("  ❌ 게임 데이터 없음")
+                    raise Exception(error_message)
             
-            # 마지막 온라인 시간 처리
-            if last_online:
-                try:
-                    # 밀리초 타임스탬프를 datetime으로 변환
-                    last_online_dt = datetime.fromtimestamp(last_online / 1000)
-                    last_online_formatted = last_online_dt.strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    # 오늘 날짜와 비교하여 경과 일수 계산
-                    now = datetime.now()
-                    days_diff = (now - last_online_dt).days
-                    
-                    if days_diff == 0:
-                        days_offline = "오늘"
-                    elif days_diff == 1:
-                        days_offline = "1일 전"
-                    else:
-                        days_offline = f"{days_diff}일 전"
-                    
-                    print(f"  ✅ 게임 정보: {nation}/{town}, 마지막 접속: {days_offline}")
-                    
-                except Exception as e:
-                    print(f"  ⚠️ 마지막 온라인 시간 처리 오류: {e}")
-                    last_online_formatted = "알 수 없음"
-                    days_offline = "알 수 없음"
-            else:
-                last_online_formatted = "정보 없음"
-                days_offline = "정보 없음"
-                print(f"  ✅ 게임 정보: {nation}/{town}, 마지막 접속: 정보 없음")
+                game_info = data2['data'][0]
+            _resident_cache[uuid] = game_info
+
+        # 모든 게임 정보 추출
+        nation = game_info.get('nation')
+        nation_uuid = game_info.get('nationUUID')  # UUID 추출 (camelCase)
+        if not nation_uuid:
+            nation_uuid = game_info.get('nationUuid')  # lowercase uuid도 시도
+
+        town = game_info.get('town')
+        town_uuid = game_info.get('townUUID')  # UUID 추출
+        if not town_uuid:
+            town_uuid = game_info.get('townUuid')
+
+        nation_ranks = game_info.get('nationRanks', '')
+        town_ranks = game_info.get('townRanks', '')
+        last_online = game_info.get('lastOnline')
+
+        # 국가 또는 마을 정보가 없는 경우 처리
+        if not nation:
+            nation = "❌"  # 국가 정보 없음
+        if not town:
+            town = "❌"  # 마을 정보 없음
         
+        # 마지막 온라인 시간 처리
+        if last_online:
+            try:
+                # 밀리초 타임스탬프를 datetime으로 변환
+                last_online_dt = datetime.fromtimestamp(last_online / 1000)
+                last_online_formatted = last_online_dt.strftime("%Y-%m-%d %H:%M:%S")
+                
+                # 오늘 날짜와 비교하여 경과 일수 계산
+                now = datetime.now()
+                days_diff = (now - last_online_dt).days
+                
+                if days_diff == 0:
+                    days_offline = "오늘"
+                elif days_diff == 1:
+                    days_offline = "1일 전"
+                else:
+                    days_offline = f"{days_diff}일 전"
+                
+                logger.info("  ✅ 게임 정보: %s/%s, 마지막 접속: %s", nation, town, days_offline)
+                
+            except Exception as e:
+                logger.warning("  ⚠️ 마지막 온라인 시간 처리 오류: %s", e)
+                last_online_formatted = "알 수 없음"
+                days_offline = "알 수 없음"
+        else:
+            last_online_formatted = "정보 없음"
+            days_offline = "정보 없음"
+            logger.info("  ✅ 게임 정보: %s/%s, 마지막 접속: 정보 없음", nation, town)
+
         # 성공 시 재시도 횟수 초기화
         clear_retry_count(user_id)
         
         # 역할 부여 및 닉네임 변경 (마을 정보 및 UUID 포함)
         role_changes = await update_user_info(
             member, mc_id, nation, guild, town,
-            nation_uuid=nation_uuid, town_uuid=town_uuid
+            nation_uuid=nation_uuid, town_uuid=town_uuid,
+            town_role_index=town_role_index
         )
 
         # 데이터베이스에 사용자 정보 저장 (UUID, Minecraft 닉네임 히스토리)
         if DATABASE_ENABLED and db_manager:
             try:
-                db_manager.add_or_update_user(
+                await asyncio.to_thread(
+                    db_manager.add_or_update_user,
                     discord_id=user_id,
                     minecraft_uuid=uuid,
                     minecraft_name=mc_id
                 )
-                print(f"  💾 데이터베이스 저장 완료: {mc_id} (UUID: {uuid[:8]}...)")
+                logger.info("  💾 데이터베이스 저장 완료: %s (UUID: %s...)", mc_id, uuid[:8])
 
                 # 국가 히스토리 저장
-                db_manager.add_nation_history(
+                await asyncio.to_thread(
+                    db_manager.add_nation_history,
                     discord_id=user_id,
                     nation_name=nation if nation and nation not in ["❌", "무소속"] else None,
                     nation_uuid=nation_uuid if nation_uuid else None,
                     town_name=town if town and town not in ["❌", "무소속"] else None,
                     town_uuid=town_uuid if town_uuid else None
                 )
-                print(f"  💾 국가 히스토리 저장 완료: {nation}/{town}")
+                logger.info("  💾 국가 히스토리 저장 완료: %s/%s", nation, town)
 
             except Exception as e:
-                print(f"  ⚠️ 데이터베이스 저장 실패: {e}")
+                logger.warning("  ⚠️ 데이터베이스 저장 실패: %s", e)
 
         # CSV 데이터 수집 (자동 실행 시)
         try:
@@ -1490,9 +2129,9 @@ async def process_single_user(bot, session, user_id):
             }
             add_to_csv_collection(csv_data)
         except Exception as e:
-            print(f"  ⚠️ CSV 데이터 수집 실패: {e}")
+            logger.warning("  ⚠️ CSV 데이터 수집 실패: %s", e)
 
-        print(f"✅ 사용자 처리 완료: {member.display_name} ({nation}, {town})")
+        logger.info("✅ 사용자 처리 완료: %s (%s, %s)", member.display_name, nation, town)
 
         # 국가/마을이 없는 경우 실패 로그로 처리하되 역할은 부여
         if nation == "❌" or town == "❌" or nation == "무소속" or town == "무소속":
@@ -1510,26 +2149,26 @@ async def process_single_user(bot, session, user_id):
             )
 
             # 마인크래프트 정보
-            minecraft_info = f"**마인크래프트 닉네임:** ``{mc_id}``"
+            parts = [f"**마인크래프트 닉네임:** ``{mc_id}``"]
             if town == "❌" or town == "무소속":
-                minecraft_info += f"\n**마을:** ❌ 정보 없음"
+                parts.append("**마을:** ❌ 정보 없음")
             else:
-                minecraft_info += f"\n**마을:** {town}"
+                parts.append(f"**마을:** {town}")
 
             if nation == "❌" or nation == "무소속":
-                minecraft_info += f"\n**국가:** ❌ 정보 없음"
+                parts.append("**국가:** ❌ 정보 없음")
             else:
-                minecraft_info += f"\n**국가:** {nation}"
+                parts.append(f"**국가:** {nation}")
             
             # 계급 정보 추가 (있는 경우)
             if nation_ranks:
-                minecraft_info += f"\n**국가 계급:** {nation_ranks}"
+                parts.append(f"**국가 계급:** {nation_ranks}")
             if town_ranks:
-                minecraft_info += f"\n**마을 계급:** {town_ranks}"
+                parts.append(f"**마을 계급:** {town_ranks}")
             
             embed.add_field(
                 name="🎮 마인크래프트 정보",
-                value=minecraft_info,
+                value="\n".join(parts),
                 inline=False
             )
             
@@ -1564,7 +2203,7 @@ async def process_single_user(bot, session, user_id):
             embed.timestamp = datetime.now()
             
             # 실패 채널에 전송
-            await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+            _log_bg(send_log_message(bot, FAILURE_CHANNEL_ID, embed))
             return
         
         # 정상적인 성공 로그 전송 (마을 역할 정보 및 마지막 온라인 포함)
@@ -1588,17 +2227,21 @@ async def process_single_user(bot, session, user_id):
         )
         
         # 마인크래프트 정보 (계급 정보 포함)
-        minecraft_info = f"**마인크래프트 닉네임:** ``{mc_id}``\n**마을:** ``{town}``\n**국가:** ``{nation}``"
+        parts = [
+            f"**마인크래프트 닉네임:** ``{mc_id}``",
+            f"**마을:** ``{town}``",
+            f"**국가:** ``{nation}``",
+        ]
         
         # 계급 정보 추가
         if nation_ranks:
-            minecraft_info += f"\n**국가 계급:** ``{nation_ranks}``"
+            parts.append(f"**국가 계급:** ``{nation_ranks}``")
         if town_ranks:
-            minecraft_info += f"\n**마을 계급:** ``{town_ranks}``"
+            parts.append(f"**마을 계급:** ``{town_ranks}``")
         
         embed.add_field(
             name="🎮 마인크래프트 정보",
-            value=minecraft_info,
+            value="\n".join(parts),
             inline=False
         )
         
@@ -1610,10 +2253,11 @@ async def process_single_user(bot, session, user_id):
         )
         
         # 재시도 정보 추가 (재시도가 있었던 경우)
-        if user_id in retry_counts:
+        retry_count = retry_counts.get(user_id)
+        if retry_count:
             embed.add_field(
                 name="🔄 재시도 정보",
-                value=f"**재시도 횟수:** {retry_counts[user_id]}회",
+                value=f"**재시도 횟수:** {retry_count}회",
                 inline=True
             )
         
@@ -1655,7 +2299,7 @@ async def process_single_user(bot, session, user_id):
         
         embed.timestamp = datetime.now()
 
-        await send_log_message(bot, SUCCESS_CHANNEL_ID, embed)
+        _log_bg(send_log_message(bot, SUCCESS_CHANNEL_ID, embed))
 
         # 성공 결과 반환
         return {
@@ -1667,7 +2311,7 @@ async def process_single_user(bot, session, user_id):
         }
 
     except Exception as e:
-        print(f"❌ 사용자 {user_id} 처리 중 오류: {e}")
+        logger.error("❌ 사용자 %s 처리 중 오류: %s", user_id, e)
 
         # 429 오류가 아닌 일반 오류의 경우 재시도 횟수 초기화
         clear_retry_count(user_id)
@@ -1675,7 +2319,7 @@ async def process_single_user(bot, session, user_id):
         # 마인크래프트 계정이 연동되지 않은 경우 모든 역할 제거 및 닉네임 초기화
         role_removal_changes = []
         if "마인크래프트 계정이 연동되지 않았습니다" in str(e) or "마인크래프트 계정 연동 정보를 찾을 수 없습니다" in str(e):
-            print(f"  🗑️ 마크 계정 미연동 - 모든 관련 역할 제거 및 닉네임 초기화 시작")
+            logger.info("  🗑️ 마크 계정 미연동 - 모든 관련 역할 제거 및 닉네임 초기화 시작")
 
             if member and guild:
                 # 0. 닉네임 설정 (역할 양식이 있으면 적용, 없으면 초기화)
@@ -1694,10 +2338,10 @@ async def process_single_user(bot, session, user_id):
                                 if format_str:
                                     role_format = format_str
                                     applied_format_name = role.name
-                                    print(f"  🎭 마크 미연동 사용자에게 역할 양식 적용: {role.name} - {format_str}")
+                                    logger.info("  🎭 마크 미연동 사용자에게 역할 양식 적용: %s - %s", role.name, format_str)
                                     break
                         except Exception as role_err:
-                            print(f"  ⚠️ 역할 양식 확인 실패: {role_err}")
+                            logger.warning("  ⚠️ 역할 양식 확인 실패: %s", role_err)
 
                     if role_format:
                         # 역할 양식이 있으면 양식 적용 (MC 정보는 ❌[ MC ] ❌로 표시)
@@ -1707,7 +2351,7 @@ async def process_single_user(bot, session, user_id):
                         try:
                             user_callsign = callsign_manager.get_callsign(member.id)
                             if user_callsign:
-                                print(f"  🏷️ 콜사인 조회됨: {user_callsign}")
+                                logger.info("  🏷️ 콜사인 조회됨: %s", user_callsign)
                         except:
                             pass
 
@@ -1722,197 +2366,89 @@ async def process_single_user(bot, session, user_id):
                         if member.nick != new_nickname:
                             await member.edit(nick=new_nickname)
                             role_removal_changes.append(f"• 닉네임 변경됨: `{original_nick}` → `{new_nickname}` (🎭 {applied_format_name} 역할 양식)")
-                            print(f"  ✅ 역할 양식으로 닉네임 설정: {original_nick} → {new_nickname}")
+                            logger.info("  ✅ 역할 양식으로 닉네임 설정: %s → %s", original_nick, new_nickname)
                         else:
-                            print(f"  ℹ️ 닉네임 유지: {new_nickname}")
+                            logger.info("  ℹ️ 닉네임 유지: %s", new_nickname)
                     else:
                         # 역할 양식이 없으면 닉네임 변경하지 않음
-                        print(f"  ℹ️ 역할 양식 없음 - 닉네임 변경 건너뜀")
+                        logger.info("  ℹ️ 역할 양식 없음 - 닉네임 변경 건너뜀")
 
                 except discord.Forbidden:
                     role_removal_changes.append(f"• ⚠️ 닉네임 변경 권한 없음")
-                    print(f"  ⚠️ 닉네임 변경 권한 없음")
+                    logger.warning("  ⚠️ 닉네임 변경 권한 없음")
                 except Exception as nick_error:
+                    _note_discord_error(nick_error)
                     role_removal_changes.append(f"• ⚠️ 닉네임 변경 실패: {str(nick_error)[:50]}")
-                    print(f"  ⚠️ 닉네임 변경 실패: {nick_error}")
+                    logger.warning("  ⚠️ 닉네임 변경 실패: %s", nick_error)
 
-                # 1. 국민 역할 제거
-                if SUCCESS_ROLE_ID != 0:
+                # 멤버 역할 ID 집합 (역할 보유 확인을 O(1)로)
+                member_role_ids = {r.id for r in member.roles}
+
+                # 제거할 역할과 로그 문구를 모은 뒤 한 번의 요청으로 제거
+                roles_to_remove = []
+                removal_labels = []
+
+                # 1. 국민 역할
+                if SUCCESS_ROLE_ID != 0 and SUCCESS_ROLE_ID in member_role_ids:
                     success_role = guild.get_role(SUCCESS_ROLE_ID)
-                    if success_role and success_role in member.roles:
-                        try:
-                            await member.remove_roles(success_role)
-                            role_removal_changes.append(f"• **{success_role.name}** 역할 제거됨")
-                            print(f"  ✅ 국민 역할 제거: {success_role.name}")
-                        except Exception as role_error:
-                            print(f"  ⚠️ 국민 역할 제거 실패: {role_error}")
-
-                # 2. 외국인 역할 제거
-                if SUCCESS_ROLE_ID_OUT != 0:
+                    if success_role:
+                        roles_to_remove.append(success_role)
+                        removal_labels.append(f"• **{success_role.name}** 역할 제거됨")
+
+                # 2. 외국인 역할
+                if SUCCESS_ROLE_ID_OUT != 0 and SUCCESS_ROLE_ID_OUT in member_role_ids:
                     out_role = guild.get_role(SUCCESS_ROLE_ID_OUT)
-                    if out_role and out_role in member.roles:
-                        try:
-                            await member.remove_roles(out_role)
-                            role_removal_changes.append(f"• **{out_role.name}** 역할 제거됨")
-                            print(f"  ✅ 외국인 역할 제거: {out_role.name}")
-                        except Exception as role_error:
-                            print(f"  ⚠️ 외국인 역할 제거 실패: {role_error}")
+                    if out_role:
+                        roles_to_remove.append(out_role)
+                        removal_labels.append(f"• **{out_role.name}** 역할 제거됨")
 
-                # 3. 모든 마을 역할 제거
+                # 3. 모든 마을 역할 (보유 역할 ∩ 매핑된 마을 역할)
                 if TOWN_ROLE_ENABLED and town_role_manager:
                     try:
-                        all_mapped_towns = town_role_manager.get_all_mappings()
-                        for mapped_town, mapped_role_id in all_mapped_towns.items():
+                        mapped_role_ids, town_names_by_role_id = town_role_index or _build_town_role_index()
+                        for mapped_role_id in member_role_ids & mapped_role_ids:
                             mapped_role = guild.get_role(mapped_role_id)
-                            if mapped_role and mapped_role in member.roles:
-                                await member.remove_roles(mapped_role)
-                                role_removal_changes.append(f"• **{mapped_town}** 마을 역할 제거됨")
-                                print(f"  ✅ 마을 역할 제거: {mapped_town}")
+                            if mapped_role:
+                                roles_to_remove.append(mapped_role)
+                                removal_labels.append(f"• **{', '.join(town_names_by_role_id[mapped_role_id])}** 마을 역할 제거됨")
                     except Exception as role_error:
-                        print(f"  ⚠️ 마을 역할 제거 실패: {role_error}")
+                        logger.warning("  ⚠️ 마을 역할 확인 실패: %s", role_error)
 
-                # 4. 모든 국가 역할 제거 (nation_role_manager에서 관리하는 역할들)
+                # 4. 모든 국가 역할 (nation_role_manager에서 관리하는 역할들)
                 if NATION_ROLE_ENABLED:
                     try:
                         from nation_role_manager import nation_role_manager
                         all_nation_roles = nation_role_manager.get_all_nation_roles()
                         for nation_name, role_info in all_nation_roles.items():
                             role_id = role_info.get('role_id')
-                            if role_id:
+                            if role_id and role_id in member_role_ids:
                                 nation_role = guild.get_role(role_id)
-                                if nation_role and nation_role in member.roles:
-                                    await member.remove_roles(nation_role)
-                                    role_removal_changes.append(f"• **`{nation_name}`** 국가 역할 제거됨")
-                                    print(f"  ✅ 국가 역할 제거: {nation_name}")
+                                if nation_role:
+                                    roles_to_remove.append(nation_role)
+                                    removal_labels.append(f"• **`{nation_name}`** 국가 역할 제거됨")
                     except Exception as role_error:
-                        print(f"  ⚠️ 국가 역할 제거 실패: {role_error}")
+                        logger.warning("  ⚠️ 국가 역할 확인 실패: %s", role_error)
 
-                if role_removal_changes:
-                    print(f"  🗑️ 총 {len(role_removal_changes)}개 역할 제거 완료")
-
-        # 실패 로그 전송
-        embed = discord.Embed(
-            title="❌ 사용자 처리 실패",
-            color=0xff0000
-        )
-
-        if member:
-            embed.add_field(
-                name="👤 사용자 정보",
-                value=f"**Discord:** {member.mention}\n**닉네임:** {member.display_name}",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="👤 사용자 정보",
-                value=f"**사용자 ID:** {user_id}",
-                inline=False
-            )
-        
-        if mc_id:
-            minecraft_info = f"**마인크래프트 닉네임:** ``{mc_id}``"
-            if town:
-                minecraft_info += f"\n**마을:** {town}"
-                # 마을 역할 연동 상태도 표시
-                if TOWN_ROLE_ENABLED and town_role_manager:
-                    role_id = town_role_manager.get_role_id_by_name(town)
-                    if role_id:
-                        town_role = guild.get_role(role_id) if guild else None
-                        if town_role:
-                            minecraft_info += f"\n**마을 역할:** {town_role.mention}"
-                        else:
-                            minecraft_info += f"\n**마을 역할:** ⚠️ 역할 없음 (ID: {role_id})"
-                    else:
-                        minecraft_info += f"\n**마을 역할:** ℹ️ 연동 안됨"
-            if nation:
-                minecraft_info += f"\n**국가:** {nation}"
-                if nation_ranks:
-                    minecraft_info += f"\n**국가 계급:** {nation_ranks}"
-            if last_online_formatted:
-                minecraft_info += f"\n**마지막 온라인:** {last_online_formatted} ({days_offline})"
-            
-            embed.add_field(
-                name="🎮 마인크래프트 정보",
-                value=minecraft_info,
-                inline=False
-            )
-
-        embed.add_field(
-            name="❌ 오류 내용",
-            value=str(e)[:1000],  # 너무 긴 오류 메시지 제한
-            inline=False
-        )
-
-        # 역할 제거 변경사항이 있으면 추가
-        if role_removal_changes:
-            embed.add_field(
-                name="🗑️ 제거된 역할",
-                value="\n".join(role_removal_changes),
-                inline=False
-            )
-
-        embed.timestamp = datetime.now()
+                # atomic=False: 역할별 요청 대신 멤버 역할 목록을 한 번의 PATCH로 갱신
+                if roles_to_remove:
+                    try:
+                        await member.remove_roles(*roles_to_remove, reason="마크 연동 해제", atomic=False)
+                        role_removal_changes.extend(removal_labels)
+                        logger.info("  ✅ 역할 제거: %s", ', '.join(r.name for r in roles_to_remove))
+                    except Exception as role_error:
+                        _note_discord_error(role_error)
+                        logger.warning("  ⚠️ 역할 제거 실패: %s", role_error)
 
-        await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+                if role_removal_changes:
+                    logger.info("  🗑️ 총 %s개 역할 제거 완료", len(role_removal_changes))
 
-    except Exception as e:
-        print(f"❌ 사용자 {user_id} 처리 중 오류: {e}")
-        
-        # 429 오류가 아닌 일반 오류의 경우 재시도 횟수 초기화
-        clear_retry_count(user_id)
-        
         # 실패 로그 전송
-        embed = discord.Embed(
-            title="❌ 사용자 처리 실패",
-            color=0xff0000
-        )
-        
-        if member:
-            embed.add_field(
-                name="👤 사용자 정보",
-                value=f"**Discord:** {member.mention}\n**닉네임:** {member.display_name}",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="👤 사용자 정보",
-                value=f"**사용자 ID:** {user_id}",
-                inline=False
-            )
-        
-        if mc_id:
-            minecraft_info = f"**마인크래프트 닉네임:** ``{mc_id}``"
-            if town:
-                minecraft_info += f"\n**마을:** {town}"
-                # 마을 역할 연동 상태도 표시
-                if TOWN_ROLE_ENABLED and town_role_manager:
-                    role_id = town_role_manager.get_role_id_by_name(town)
-                    if role_id:
-                        town_role = guild.get_role(role_id) if guild else None
-                        if town_role:
-                            minecraft_info += f"\n**마을 역할:** {town_role.mention}"
-                        else:
-                            minecraft_info += f"\n**마을 역할:** ⚠️ 역할 없음 (ID: {role_id})"
-                    else:
-                        minecraft_info += f"\n**마을 역할:** ℹ️ 연동 안됨"
-            if nation:
-                minecraft_info += f"\n**국가:** {nation}"
-            
-            embed.add_field(
-                name="🎮 마인크래프트 정보",
-                value=minecraft_info,
-                inline=False
-            )
-        
-        embed.add_field(
-            name="❌ 오류 내용",
-            value=str(e)[:1000],  # 너무 긴 오류 메시지 제한
-            inline=False
+        embed = _build_failure_embed(
+            member, user_id, mc_id, town, nation, nation_ranks,
+            last_online_formatted, days_offline, e,
+            role_removal_changes=role_removal_changes, guild=guild
         )
-        
-        embed.timestamp = datetime.now()
-
-        await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+        _log_bg(send_log_message(bot, FAILURE_CHANNEL_ID, embed))
 
         # 실패 결과 반환
         return {
@@ -1925,17 +2461,17 @@ async def execute_auto_roles(bot):
     global _is_auto_execution
 
     try:
-        print("🎯 자동 역할 실행 시작")
+        logger.info("🎯 자동 역할 실행 시작")
 
         # 자동 실행 플래그 설정 (CSV 수집 활성화)
         _is_auto_execution = True
-        print("📋 CSV 데이터 수집 활성화됨 (스케줄러 자동 실행)")
+        logger.info("📋 CSV 데이터 수집 활성화됨 (스케줄러 자동 실행)")
 
         # 자동역할 관리자에서 역할 목록 가져오기
         role_ids = auto_role_manager.get_roles()
 
         if not role_ids:
-            print("⚠️ 자동처리로 설정된 역할이 없습니다.")
+            logger.warning("⚠️ 자동처리로 설정된 역할이 없습니다.")
 
             # 실패 로그 전송
             embed = discord.Embed(
@@ -1954,61 +2490,61 @@ async def execute_auto_roles(bot):
 
         added_count = 0
         processed_roles = []
-        invalid_roles = []
+        invalid_roles = set()  # 중복 제거용
+        scanned = 0  # 마지막 양보 이후 확인한 멤버 수
+        work_since_yield = 0  # 마지막 양보 이후 대기열에 추가한 수
+        exception_ids = exception_manager.get_all_exception_ids()
 
         # 각 길드에서 역할 멤버들을 대기열에 추가
         for guild in bot.guilds:
-            print(f"🏰 길드 처리: {guild.name}")
+            logger.info("🏰 길드 처리: %s", guild.name)
 
             for role_id in role_ids:
                 try:
                     role = guild.get_role(role_id)
 
                     if not role:
-                        print(f"⚠️ 역할을 찾을 수 없음: {role_id}")
-                        if role_id not in invalid_roles:
-                            invalid_roles.append(role_id)
+                        logger.warning("⚠️ 역할을 찾을 수 없음: %s", role_id)
+                        invalid_roles.add(role_id)
                         continue
 
-                    print(f"👥 역할 '{role.name}' 멤버 {len(role.members)}명 처리 중")
+                    members = role.members
+                    member_count = len(members)
 
-                    role_added_count = 0
-                    for idx, member in enumerate(role.members):
-                        # 예외 목록 확인
-                        if exception_manager.is_exception(member.id):
-                            print(f"  ⏭️ 예외 대상 건너뜀: {member.display_name}")
-                            continue
+                    # 예외 대상을 제외하고 한 번에 대기열에 추가 (이미 대기열에 있는 사용자는 add_users가 건너뜀)
+                    candidate_ids = [m.id for m in members if m.id not in exception_ids]
+                    role_added_count = len(queue_manager.add_users(candidate_ids))
+                    added_count += role_added_count
 
-                        # 대기열에 추가
-                        if queue_manager.add_user(member.id):
-                            added_count += 1
-                            role_added_count += 1
-                            print(f"  ➕ 대기열 추가: {member.display_name}")
-                        else:
-                            print(f"  ⏭️ 이미 대기열에 있음: {member.display_name}")
+                    # 역할마다 집계 결과만 한 줄로 출력
+                    skipped_exception = member_count - len(candidate_ids)
+                    skipped_duplicate = len(candidate_ids) - role_added_count
+                    logger.info("👥 역할 '%s' %s명 - 추가 %s명, 중복 %s명, 예외 %s명", role.name, member_count, role_added_count, skipped_duplicate, skipped_exception)
 
-                        # 50명마다 비동기 제어권 양보 (블로킹 방지)
-                        if (idx + 1) % 50 == 0:
-                            await asyncio.sleep(0)
-                            print(f"  ⏸️ 처리 진행 중... ({idx + 1}/{len(role.members)})")
+                    # 500명 이상 확인했고 실제로 추가한 경우에만 비동기 제어권 양보 (블로킹 방지)
+                    scanned += member_count
+                    work_since_yield += role_added_count
+                    if scanned >= 500 and work_since_yield > 0:
+                        scanned = 0
+                        work_since_yield = 0
+                        await asyncio.sleep(0)
 
                     # 처리된 역할 정보 저장
                     processed_roles.append({
                         'role': role,
-                        'total_members': len(role.members),
+                        'total_members': member_count,
                         'added_members': role_added_count
                     })
 
                 except Exception as e:
-                    print(f"⚠️ 역할 처리 오류 ({role_id}): {e}")
-                    if role_id not in invalid_roles:
-                        invalid_roles.append(role_id)
+                    logger.warning("⚠️ 역할 처리 오류 (%s): %s", role_id, e)
+                    invalid_roles.add(role_id)
                     continue
-
-                # 역할 사이마다 비동기 제어권 양보
-                await asyncio.sleep(0)
         
-        print(f"✅ 자동 역할 실행 완료 - {added_count}명 대기열 추가")
+        logger.info("✅ 자동 역할 실행 완료 - %s명 대기열 추가", added_count)
+        
+        n_processed = len(processed_roles)
+        n_invalid = len(invalid_roles)
         
         # 자동 역할 실행 완료 로그 전송
         embed = discord.Embed(
@@ -2025,8 +2561,8 @@ async def execute_auto_roles(bot):
                     f"• {info['role'].mention}: {info['added_members']}/{info['total_members']}명 추가"
                 )
             
-            if len(processed_roles) > 10:
-                role_info_lines.append(f"• ...그리고 {len(processed_roles) - 10}개 역할 더")
+            if n_processed > 10:
+                role_info_lines.append(f"• ...그리고 {n_processed - 10}개 역할 더")
             
             embed.add_field(
                 name="📋 처리된 역할",
@@ -2038,7 +2574,7 @@ async def execute_auto_roles(bot):
         if invalid_roles:
             embed.add_field(
                 name="⚠️ 무효한 역할",
-                value=f"{len(invalid_roles)}개의 역할을 찾을 수 없습니다.\n"
+                value=f"{n_invalid}개의 역할을 찾을 수 없습니다.\n"
                       f"관리자는 `/자동역할 기능:정리`로 무효한 역할들을 제거할 수 있습니다.",
                 inline=False
             )
@@ -2061,7 +2597,7 @@ async def execute_auto_roles(bot):
         
         # 429 오류 상태 정보 추가
         if rate_limit_detected:
-            rate_limit_unix = int(rate_limit_until.timestamp())
+            rate_limit_unix = int(rate_limit_until_dt.timestamp())
             embed.add_field(
                 name="⚠️ API 상태",
                 value=f"API 속도 제한이 감지되었습니다.\n해제 예정: <t:{rate_limit_unix}:F> (<t:{rate_limit_unix}:R>)",
@@ -2070,11 +2606,13 @@ async def execute_auto_roles(bot):
         
         embed.timestamp = datetime.now()
 
-        await send_log_message(bot, SUCCESS_CHANNEL_ID, embed)
-        await send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+        await asyncio.gather(
+            send_log_message(bot, SUCCESS_CHANNEL_ID, embed),
+            send_log_message(bot, FAILURE_CHANNEL_ID, embed)
+        )
 
     except Exception as e:
-        print(f"❌ 자동 역할 실행 오류: {e}")
+        logger.error("❌ 자동 역할 실행 오류: %s", e)
 
         # 자동 역할 실행 실패 로그 전송
         embed = discord.Embed(
@@ -2096,4 +2634,4 @@ async def execute_auto_roles(bot):
     finally:
         # 자동 실행 플래그 해제 (CSV 수집 비활성화)
         _is_auto_execution = False
-        print("📋 CSV 데이터 수집 비활성화됨 (자동 실행 종료)")
\ No newline at end of file
+        logger.info("📋 CSV 데이터 수집 비활성화됨 (자동 실행 종료)")
\ No newline at end of file
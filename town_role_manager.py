@@ -4,10 +4,42 @@
 기존 Discord 역할과 마인크래프트 마을을 연동하는 기능을 제공합니다.
 """
 
+import asyncio
 import json
 import os
 import aiohttp
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+try:
+    import orjson  # 설치되어 있으면 더 빠른 JSON 직렬화 사용
+except ImportError:
+    orjson = None
+
+class TownRecord:
+    """마을 1개의 역할 매핑 정보 (마을 수가 많아도 메모리를 적게 쓰도록 __slots__ 사용)"""
+
+    __slots__ = ('role_id', 'town_name', 'nation_name')
+
+    def __init__(self, role_id: int, town_name: str, nation_name: str):
+        self.role_id = role_id
+        self.town_name = town_name
+        self.nation_name = nation_name
+
+    @classmethod
+    def from_dict(cls, info: Dict) -> "TownRecord":
+        """파일에 저장된 딕셔너리에서 생성 (형식이 잘못되면 KeyError/TypeError/ValueError)"""
+        return cls(int(info['role_id']), str(info['town_name']), str(info.get('nation_name', '')))
+
+    def to_dict(self) -> Dict:
+        """저장/외부 반환용 딕셔너리로 변환"""
+        return {
+            'role_id': self.role_id,
+            'town_name': self.town_name,
+            'nation_name': self.nation_name
+        }
+
+    def __repr__(self):
+        return f"TownRecord(role_id={self.role_id}, town_name={self.town_name!r}, nation_name={self.nation_name!r})"
 
 class TownRoleManager:
     """마을-역할 매핑을 관리하는 클래스 (UUID 기반)"""
@@ -17,50 +49,144 @@ class TownRoleManager:
         os.makedirs("data", exist_ok=True)
 
         self.filename = filename
-        self._mapping: Dict[str, Dict] = {}  # nation_uuid -> { town_uuid -> { role_id, town_name, nation_name } }
+        self._mapping: Dict[str, Dict[str, TownRecord]] = {}  # nation_uuid -> { town_uuid -> TownRecord }
+        self._role_index: Optional[Tuple[FrozenSet[int], Dict[int, Tuple[str, ...]]]] = None  # get_role_index() 캐시
+        self._name_index: Dict[str, Tuple[str, str]] = {}  # town_name -> (nation_uuid, town_uuid)
+        self._total_towns = 0  # 매핑된 마을 수 (추가/제거 시 갱신)
+        self._dirty = False  # 저장되지 않은 변경 사항 여부
+        self._flush_handle: Optional[asyncio.TimerHandle] = None  # 예약된 지연 저장
         self.load_mapping()
 
     def load_mapping(self):
         """마을-역할 매핑을 파일에서 로드"""
+        self._role_index = None
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.filename, 'rb') as f:
+                    raw = f.read()
+                    data = orjson.loads(raw) if orjson else json.loads(raw)
 
                     # 새 형식(UUID 기반) 확인
                     if 'version' in data and data['version'] == '2.0':
-                        self._mapping = data.get('mappings', {})
-                        print(f"✅ 마을 역할 매핑 로드 (UUID): {self._count_total_towns()}개")
+                        self._mapping = self._parse_mappings(data.get('mappings', {}))
+                        self._total_towns = self._count_total_towns()
+                        print(f"✅ 마을 역할 매핑 로드 (UUID): {self._total_towns}개")
                     else:
                         # 구 형식(이름 기반) - 마이그레이션 필요
                         print(f"⚠️ 구 형식의 매핑 파일 감지. UUID 기반으로 마이그레이션이 필요합니다.")
                         self._mapping = {}
-                        self.save_mapping()
+                        self._total_towns = 0
+                        self._save_now()
             else:
                 print(f"📁 마을 역할 매핑 파일이 없어서 새로 생성합니다: {self.filename}")
-                self.save_mapping()
+                self._save_now()
         except Exception as e:
             print(f"❌ 마을 역할 매핑 로드 실패: {e}")
             self._mapping = {}
-
-    def save_mapping(self):
-        """마을-역할 매핑을 파일에 저장"""
+            self._total_towns = 0
+
+        self._rebuild_name_index()
+
+    @staticmethod
+    def _parse_mappings(raw: Dict) -> Dict[str, Dict[str, TownRecord]]:
+        """파일의 매핑을 TownRecord로 변환 (로드할 때 한 번만 검증, 잘못된 항목은 건너뜀)"""
+        mapping = {}
+        for nation_uuid, towns in raw.items():
+            if not isinstance(towns, dict):
+                print(f"⚠️ 잘못된 국가 매핑 건너뜀: {nation_uuid}")
+                continue
+            records = {}
+            for town_uuid, info in towns.items():
+                try:
+                    records[str(town_uuid)] = TownRecord.from_dict(info)
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    print(f"⚠️ 잘못된 마을 매핑 건너뜀: {nation_uuid}/{town_uuid}")
+            if records:
+                mapping[str(nation_uuid)] = records
+        return mapping
+
+    def _rebuild_name_index(self):
+        """마을 이름 → (국가 UUID, 마을 UUID) 인덱스 재구성 (이름이 겹치면 먼저 나온 마을 우선)"""
+        self._name_index = {}
+        for nation_uuid, towns in self._mapping.items():
+            for town_uuid, record in towns.items():
+                self._name_index.setdefault(record.town_name, (nation_uuid, town_uuid))
+
+    def _drop_name(self, town_name: str, nation_uuid: str, town_uuid: str):
+        """이름 인덱스에서 해당 마을 제거 (같은 이름의 다른 마을이 있으면 그 마을로 교체)"""
+        if self._name_index.get(town_name) != (nation_uuid, town_uuid):
+            return
+
+        del self._name_index[town_name]
+        for other_nation_uuid, towns in self._mapping.items():
+            for other_town_uuid, record in towns.items():
+                if record.town_name == town_name and (other_nation_uuid, other_town_uuid) != (nation_uuid, town_uuid):
+                    self._name_index[town_name] = (other_nation_uuid, other_town_uuid)
+                    return
+
+    def _save_now(self) -> bool:
+        """마을-역할 매핑을 파일에 즉시 저장 (임시 파일에 쓴 뒤 교체)"""
+        self._dirty = False
+        tmp_filename = self.filename + ".tmp"
         try:
             data = {
                 'version': '2.0',
                 'description': 'UUID 기반 마을-역할 매핑 (국가 UUID -> 마을 UUID -> 역할 정보)',
-                'mappings': self._mapping,
+                'mappings': {
+                    nation_uuid: {town_uuid: record.to_dict() for town_uuid, record in towns.items()}
+                    for nation_uuid, towns in self._mapping.items()
+                },
                 'total_nations': len(self._mapping),
-                'total_towns': self._count_total_towns()
+                'total_towns': self._total_towns
             }
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                with open(tmp_filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(tmp_filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_filename, self.filename)
             print(f"💾 마을 역할 매핑 저장: {data['total_towns']}개 마을")
+            return True
         except Exception as e:
+            # 다음 저장 때 다시 시도하도록 변경 표시 유지
+            self._dirty = True
             print(f"❌ 마을 역할 매핑 저장 실패: {e}")
+            return False
+
+    def _schedule_save(self, delay: float = 1.0):
+        """
+        변경 사항 저장 예약
+
+        delay 초 안에 들어온 변경은 한 번의 파일 쓰기로 합칩니다.
+        이벤트 루프 밖(스크립트 실행 등)에서는 바로 저장합니다.
+        """
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_now()
+            return
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(delay, self._flush)
+
+    def _flush(self):
+        """예약된 저장 실행"""
+        self._flush_handle = None
+        if self._dirty:
+            self._save_now()
+
+    async def flush(self):
+        """대기 중인 변경 사항을 즉시 저장 (봇 종료 시 호출)"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty:
+            self._save_now()
 
     def _count_total_towns(self) -> int:
-        """전체 매핑된 마을 수 계산"""
+        """전체 매핑된 마을 수 계산 (로드 시에만 사용, 이후에는 _total_towns 사용)"""
         count = 0
         for nation_data in self._mapping.values():
             count += len(nation_data)
@@ -78,86 +204,116 @@ class TownRoleManager:
         if nation_uuid not in self._mapping:
             self._mapping[nation_uuid] = {}
 
-        self._mapping[nation_uuid][town_uuid] = {
-            'role_id': role_id,
-            'town_name': town_name,
-            'nation_name': nation_name
-        }
+        old_record = self._mapping[nation_uuid].get(town_uuid)
+        if old_record is None:
+            self._total_towns += 1
+        elif old_record.town_name != town_name:
+            self._drop_name(old_record.town_name, nation_uuid, town_uuid)
+
+        self._mapping[nation_uuid][town_uuid] = TownRecord(role_id, town_name, nation_name)
+        self._name_index.setdefault(town_name, (nation_uuid, town_uuid))
+        self._role_index = None
 
-        self.save_mapping()
+        self._schedule_save()
         print(f"➕ 마을 역할 매핑 추가: {nation_name}/{town_name} (UUID: {town_uuid}) -> {role_id}")
         return True
 
     def remove_mapping(self, nation_uuid: str, town_uuid: str) -> bool:
         """마을-역할 매핑 제거 (UUID 기반)"""
         if nation_uuid in self._mapping and town_uuid in self._mapping[nation_uuid]:
-            town_info = self._mapping[nation_uuid][town_uuid]
+            record = self._mapping[nation_uuid][town_uuid]
             del self._mapping[nation_uuid][town_uuid]
+            self._total_towns -= 1
 
             # 국가에 더 이상 마을이 없으면 국가 키도 제거
             if not self._mapping[nation_uuid]:
                 del self._mapping[nation_uuid]
+            self._drop_name(record.town_name, nation_uuid, town_uuid)
+            self._role_index = None
 
-            self.save_mapping()
-            print(f"➖ 마을 역할 매핑 제거: {town_info['nation_name']}/{town_info['town_name']}")
+            self._schedule_save()
+            print(f"➖ 마을 역할 매핑 제거: {record.nation_name}/{record.town_name}")
             return True
         return False
 
     def remove_mapping_by_name(self, town_name: str) -> bool:
         """마을-역할 매핑 제거 (이름 기반, 하위 호환용)"""
-        for nation_uuid, towns in self._mapping.items():
-            for town_uuid, town_info in towns.items():
-                if town_info['town_name'] == town_name:
-                    return self.remove_mapping(nation_uuid, town_uuid)
+        key = self._name_index.get(town_name)
+        if key:
+            return self.remove_mapping(*key)
         return False
 
     def get_role_id(self, nation_uuid: str, town_uuid: str) -> Optional[int]:
         """마을에 해당하는 역할 ID 반환 (UUID 기반)"""
         if nation_uuid in self._mapping and town_uuid in self._mapping[nation_uuid]:
-            return self._mapping[nation_uuid][town_uuid]['role_id']
+            return self._mapping[nation_uuid][town_uuid].role_id
         return None
 
     def get_role_id_by_name(self, town_name: str) -> Optional[int]:
         """마을에 해당하는 역할 ID 반환 (이름 기반, 하위 호환용)"""
-        for nation_data in self._mapping.values():
-            for town_info in nation_data.values():
-                if town_info['town_name'] == town_name:
-                    return town_info['role_id']
+        key = self._name_index.get(town_name)
+        if key:
+            return self._mapping[key[0]][key[1]].role_id
         return None
 
     def get_town_info(self, nation_uuid: str, town_uuid: str) -> Optional[Dict]:
         """마을 정보 반환"""
         if nation_uuid in self._mapping and town_uuid in self._mapping[nation_uuid]:
-            return self._mapping[nation_uuid][town_uuid].copy()
+            return self._mapping[nation_uuid][town_uuid].to_dict()
         return None
 
     def get_town_info_by_name(self, town_name: str) -> Optional[Dict]:
         """마을 정보 반환 (이름 기반)"""
-        for nation_uuid, nation_data in self._mapping.items():
-            for town_uuid, town_info in nation_data.items():
-                if town_info['town_name'] == town_name:
-                    return {
-                        'nation_uuid': nation_uuid,
-                        'town_uuid': town_uuid,
-                        **town_info
-                    }
+        key = self._name_index.get(town_name)
+        if key:
+            nation_uuid, town_uuid = key
+            return {
+                'nation_uuid': nation_uuid,
+                'town_uuid': town_uuid,
+                **self._mapping[nation_uuid][town_uuid].to_dict()
+            }
         return None
 
     def get_all_mappings(self) -> Dict[str, Dict]:
-        """모든 매핑 반환 (UUID 기반)"""
-        return self._mapping.copy()
+        """모든 매핑 반환 (UUID 기반, 국가 UUID -> 마을 UUID -> 역할 정보 딕셔너리)"""
+        return {
+            nation_uuid: {town_uuid: record.to_dict() for town_uuid, record in towns.items()}
+            for nation_uuid, towns in self._mapping.items()
+        }
+
+    def iter_mappings(self) -> Iterator[Tuple[str, str, TownRecord]]:
+        """(국가 UUID, 마을 UUID, TownRecord)를 차례로 반환 (리스트/딕셔너리 복사 없음, 레코드는 수정하지 말 것)"""
+        for nation_uuid, nation_data in self._mapping.items():
+            for town_uuid, record in nation_data.items():
+                yield nation_uuid, town_uuid, record
+
+    def iter_mapped_town_names(self) -> Iterator[str]:
+        """매핑된 마을 이름을 차례로 반환"""
+        for _, _, record in self.iter_mappings():
+            yield record.town_name
 
     def get_all_mappings_flat(self) -> List[Dict]:
         """모든 매핑을 평면화된 리스트로 반환"""
-        result = []
-        for nation_uuid, nation_data in self._mapping.items():
-            for town_uuid, town_info in nation_data.items():
-                result.append({
-                    'nation_uuid': nation_uuid,
-                    'town_uuid': town_uuid,
-                    **town_info
-                })
-        return result
+        return [
+            {'nation_uuid': nation_uuid, 'town_uuid': town_uuid, **record.to_dict()}
+            for nation_uuid, town_uuid, record in self.iter_mappings()
+        ]
+
+    def get_role_index(self) -> Tuple[FrozenSet[int], Dict[int, Tuple[str, ...]]]:
+        """
+        (매핑된 역할 ID 집합, 역할 ID → 마을 이름 튜플) 반환
+
+        여러 마을이 같은 역할을 공유할 수 있으므로 역할마다 매핑된 마을 이름을 모두 담습니다.
+        매핑이 바뀔 때만 다시 계산하므로 사용자마다 호출해도 비용이 없습니다.
+        """
+        if self._role_index is None:
+            towns_by_id: Dict[int, List[str]] = {}
+            for nation_data in self._mapping.values():
+                for record in nation_data.values():
+                    towns_by_id.setdefault(record.role_id, []).append(record.town_name)
+            town_names_by_id = {role_id: tuple(names) for role_id, names in towns_by_id.items()}
+            self._role_index = (frozenset(town_names_by_id), town_names_by_id)
+        return self._role_index
 
     def get_mapped_towns_in_nation(self, nation_uuid: str) -> List[Dict]:
         """특정 국가의 매핑된 마을 목록 반환"""
@@ -165,24 +321,20 @@ class TownRoleManager:
             return []
 
         result = []
-        for town_uuid, town_info in self._mapping[nation_uuid].items():
+        for town_uuid, record in self._mapping[nation_uuid].items():
             result.append({
                 'town_uuid': town_uuid,
-                **town_info
+                **record.to_dict()
             })
         return result
 
     def get_mapped_towns(self) -> List[str]:
         """매핑된 마을 이름 목록 반환 (하위 호환용)"""
-        towns = []
-        for nation_data in self._mapping.values():
-            for town_info in nation_data.values():
-                towns.append(town_info['town_name'])
-        return towns
+        return list(self.iter_mapped_town_names())
 
     def get_mapping_count(self) -> int:
         """매핑된 마을-역할 개수 반환"""
-        return self._count_total_towns()
+        return self._total_towns
 
     def is_town_mapped(self, nation_uuid: str, town_uuid: str) -> bool:
         """마을이 역할과 매핑되어 있는지 확인 (UUID 기반)"""
@@ -190,25 +342,30 @@ class TownRoleManager:
 
     def is_town_mapped_by_name(self, town_name: str) -> bool:
         """마을이 역할과 매핑되어 있는지 확인 (이름 기반)"""
-        for nation_data in self._mapping.values():
-            for town_info in nation_data.values():
-                if town_info['town_name'] == town_name:
-                    return True
-        return False
+        return town_name in self._name_index
 
     def clear_all_mappings(self) -> int:
         """모든 매핑 삭제 및 삭제된 개수 반환"""
-        count = self._count_total_towns()
+        count = self._total_towns
         self._mapping.clear()
-        self.save_mapping()
+        self._total_towns = 0
+        self._name_index.clear()
+        self._role_index = None
+        self._schedule_save()
         print(f"🗑️ 모든 마을 역할 매핑 삭제: {count}개")
         return count
 
     def update_town_name(self, nation_uuid: str, town_uuid: str, new_town_name: str) -> bool:
         """마을 이름 업데이트"""
         if nation_uuid in self._mapping and town_uuid in self._mapping[nation_uuid]:
-            self._mapping[nation_uuid][town_uuid]['town_name'] = new_town_name
-            self.save_mapping()
+            record = self._mapping[nation_uuid][town_uuid]
+            old_town_name = record.town_name
+            record.town_name = new_town_name
+            if old_town_name != new_town_name:
+                self._drop_name(old_town_name, nation_uuid, town_uuid)
+                self._name_index.setdefault(new_town_name, (nation_uuid, town_uuid))
+            self._role_index = None
+            self._schedule_save()
             print(f"✏️ 마을 이름 업데이트: {town_uuid} -> {new_town_name}")
             return True
         return False
@@ -219,17 +376,37 @@ class TownRoleManager:
             return 0
 
         count = 0
-        for town_info in self._mapping[nation_uuid].values():
-            town_info['nation_name'] = new_nation_name
+        for record in self._mapping[nation_uuid].values():
+            record.nation_name = new_nation_name
             count += 1
 
-        self.save_mapping()
+        self._schedule_save()
         print(f"✏️ 국가 이름 업데이트: {nation_uuid} -> {new_nation_name} ({count}개 마을)")
         return count
 
 # 전역 마을 역할 관리자 인스턴스
 town_role_manager = TownRoleManager()
 
+# 마을 목록 조회용 공유 HTTP 세션 (keep-alive 연결 재사용)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """공유 HTTP 세션 반환 (없거나 닫혔으면 이벤트 루프 안에서 새로 생성)"""
+    global _http_session
+
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        _http_session = aiohttp.ClientSession(connector=connector)
+    return _http_session
+
+async def close_http_session():
+    """공유 HTTP 세션 종료 (봇 종료 시 호출)"""
+    global _http_session
+
+    session, _http_session = _http_session, None
+    if session is not None and not session.closed:
+        await session.close()
+
 async def get_towns_in_nation(nation_name: str = None, nation_uuid: str = None) -> List[Dict]:
     """특정 국가의 마을 목록 조회 (UUID 기반)"""
     try:
@@ -241,58 +418,58 @@ async def get_towns_in_nation(nation_name: str = None, nation_uuid: str = None)
             import os
             api_base = os.getenv("MC_API_BASE", "https://api.planetearth.kr")
 
-        async with aiohttp.ClientSession() as session:
-            # UUID 우선, 없으면 이름 사용
-            if nation_uuid:
-                url = f"{api_base}/nation?uuid={nation_uuid}"
-            elif nation_name:
-                url = f"{api_base}/nation?name={nation_name}"
-            else:
-                print("❌ 국가 이름 또는 UUID가 필요합니다")
+        # UUID 우선, 없으면 이름 사용
+        if nation_uuid:
+            url = f"{api_base}/nation?uuid={nation_uuid}"
+        elif nation_name:
+            url = f"{api_base}/nation?name={nation_name}"
+        else:
+            print("❌ 국가 이름 또는 UUID가 필요합니다")
+            return []
+
+        print(f"🔍 국가 정보 조회: {url}")
+
+        session = _get_http_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                print(f"❌ 국가 정보 조회 실패: HTTP {response.status}")
                 return []
 
-            print(f"🔍 국가 정보 조회: {url}")
-
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status != 200:
-                    print(f"❌ 국가 정보 조회 실패: HTTP {response.status}")
-                    return []
-
-                data = await response.json()
-                if not data.get('data') or not data['data']:
-                    print(f"❌ 국가 데이터 없음")
-                    return []
-
-                nation_data = data['data'][0]
-                nation_uuid_result = nation_data.get('uuid')
-                nation_name_result = nation_data.get('name')
-                towns = nation_data.get('towns', [])
-
-                if not towns:
-                    print(f"ℹ️ {nation_name_result}에 마을이 없습니다.")
-                    return []
-
-                # 마을 정보를 { name, uuid } 형태로 변환
-                town_list = []
-                for town in towns:
-                    if isinstance(town, dict):
-                        town_list.append({
-                            'name': town.get('name'),
-                            'uuid': town.get('uuid'),
-                            'nation_name': nation_name_result,
-                            'nation_uuid': nation_uuid_result
-                        })
-                    else:
-                        # 레거시: 문자열만 있는 경우
-                        town_list.append({
-                            'name': town,
-                            'uuid': None,
-                            'nation_name': nation_name_result,
-                            'nation_uuid': nation_uuid_result
-                        })
+            data = await response.json()
+            if not data.get('data') or not data['data']:
+                print(f"❌ 국가 데이터 없음")
+                return []
+
+            nation_data = data['data'][0]
+            nation_uuid_result = nation_data.get('uuid')
+            nation_name_result = nation_data.get('name')
+            towns = nation_data.get('towns', [])
+
+            if not towns:
+                print(f"ℹ️ {nation_name_result}에 마을이 없습니다.")
+                return []
 
-                print(f"✅ {nation_name_result} 마을 목록: {len(town_list)}개")
-                return town_list
+            # 마을 정보를 { name, uuid } 형태로 변환
+            town_list = []
+            for town in towns:
+                if isinstance(town, dict):
+                    town_list.append({
+                        'name': town.get('name'),
+                        'uuid': town.get('uuid'),
+                        'nation_name': nation_name_result,
+                        'nation_uuid': nation_uuid_result
+                    })
+                else:
+                    # 레거시: 문자열만 있는 경우
+                    town_list.append({
+                        'name': town,
+                        'uuid': None,
+                        'nation_name': nation_name_result,
+                        'nation_uuid': nation_uuid_result
+                    })
+
+            print(f"✅ {nation_name_result} 마을 목록: {len(town_list)}개")
+            return town_list
 
     except Exception as e:
         print(f"❌ 마을 목록 조회 오류: {e}")
@@ -372,14 +549,14 @@ def get_unmapped_towns(all_towns: List[Dict]) -> List[Dict]:
 def get_mapped_towns_with_roles(guild) -> List[Dict]:
     """매핑된 마을들의 역할 정보 반환"""
     results = []
-    for town_data in town_role_manager.get_all_mappings_flat():
-        role_id = town_data['role_id']
+    for nation_uuid, town_uuid, record in town_role_manager.iter_mappings():
+        role_id = record.role_id
         role = guild.get_role(role_id) if guild else None
         results.append({
-            'town_name': town_data['town_name'],
-            'town_uuid': town_data['town_uuid'],
-            'nation_name': town_data['nation_name'],
-            'nation_uuid': town_data['nation_uuid'],
+            'town_name': record.town_name,
+            'town_uuid': town_uuid,
+            'nation_name': record.nation_name,
+            'nation_uuid': nation_uuid,
             'role_id': role_id,
             'role': role,
             'role_exists': role is not None
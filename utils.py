@@ -1,5 +1,9 @@
 # utils.py - 개선된 버전
 import datetime
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
 
 def log_message(msg: str):
     print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {msg}")
@@ -17,9 +21,13 @@ def format_duration(seconds: int) -> str:
     if seconds <= 0:
         return "즉시"
     
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    remaining_seconds = seconds % 60
+    return _format_duration_cached(seconds)
+
+@functools.lru_cache(maxsize=256)
+def _format_duration_cached(seconds: int) -> str:
+    """format_duration 본체 (대기열 크기에서 나온 값이 자주 반복되므로 결과 캐시)"""
+    hours, rem = divmod(seconds, 3600)
+    minutes, remaining_seconds = divmod(rem, 60)
     
     parts = []
     
@@ -68,6 +76,56 @@ def format_time_until(target_datetime: datetime.datetime) -> str:
     
     return format_duration(total_seconds)
 
+class TTLCache(MutableMapping):
+    """
+    항목마다 만료 시간(TTL)이 있는 크기 제한 딕셔너리
+
+    값을 쓸 때마다 만료 시간이 갱신되며, 만료된 항목은 조회 시 자동으로 제거됩니다.
+    최대 크기를 넘으면 가장 오래된 항목부터 제거합니다.
+
+    Args:
+        maxsize (int): 최대 항목 수
+        ttl (float): 항목 유지 시간 (초)
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (value, expires_at), 만료 시간 순으로 정렬됨
+
+    def _expire(self):
+        """만료된 항목 제거 (앞쪽이 가장 먼저 만료됨)"""
+        now = time.monotonic()
+        while self._data:
+            key, (_, expires_at) = next(iter(self._data.items()))
+            if expires_at > now:
+                break
+            del self._data[key]
+
+    def __getitem__(self, key):
+        value, expires_at = self._data[key]
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        self._expire()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
 # 테스트용 함수
 def test_format_duration():
     """format_duration 함수 테스트"""